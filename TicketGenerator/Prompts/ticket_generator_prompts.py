@@ -55,7 +55,7 @@ TICKET_GENERATOR_GUIDELINES = """
 **CRITICAL**: Each sentiment has distinct emotional boundaries - never cross them.
 """
 
-TICKET_GENERATOR_EXAMPLES = """
+TICKET_GENERATOR_EXAMPLE_NEGATIVE = """
 --- EXAMPLE NEGATIVE SENTIMENT TICKET ---
 
 Subject: UNACCEPTABLE: Production Lambda Failures - Fix NOW
@@ -71,9 +71,9 @@ Customer Contact Information:
 Name: Marcus Thompson
 Email: m.thompson@techcorp.com
 Company: TechCorp Solutions
+"""
 
----------------------------------------------------
-
+TICKET_GENERATOR_EXAMPLE_SLIGHTLY_NEGATIVE = """
 --- EXAMPLE SLIGHTLY NEGATIVE SENTIMENT TICKET ---
 
 Subject: S3 Lifecycle Policy Not Working as Expected
@@ -89,9 +89,9 @@ Customer Contact Information:
 Name: Lisa Chen
 Email: l.chen@dataflow.com
 Company: DataFlow Analytics
+"""
 
----------------------------------------------------
-
+TICKET_GENERATOR_EXAMPLE_NEUTRAL = """
 --- EXAMPLE NEUTRAL SENTIMENT TICKET ---
 
 Subject: Redshift Connection Timeout After Security Update
@@ -111,9 +111,9 @@ Customer Contact Information:
 Name: Sarah Johnson
 Email: s.johnson@datatech.com
 Company: DataTech Solutions
+"""
 
----------------------------------------------------
-
+TICKET_GENERATOR_EXAMPLE_SLIGHTLY_POSITIVE = """
 --- EXAMPLE SLIGHTLY POSITIVE SENTIMENT TICKET ---
 
 Subject: Kinesis Working Well - Small Alerting Question
@@ -129,9 +129,9 @@ Customer Contact Information:
 Name: Alex Rivera
 Email: a.rivera@streamtech.io
 Company: StreamTech Labs
+"""
 
----------------------------------------------------
-
+TICKET_GENERATOR_EXAMPLE_POSITIVE = """
 --- EXAMPLE POSITIVE SENTIMENT TICKET ---
 
 Subject: Excellent Service - Quick Config Question
@@ -149,6 +149,15 @@ Email: j.williams@brightdata.com
 Company: Bright Data Solutions
 """
 
+# Only the example matching the target sentiment is included in the prompt
+TICKET_GENERATOR_EXAMPLES_BY_SENTIMENT = {
+    "NEGATIVE": TICKET_GENERATOR_EXAMPLE_NEGATIVE,
+    "SLIGHTLY NEGATIVE": TICKET_GENERATOR_EXAMPLE_SLIGHTLY_NEGATIVE,
+    "NEUTRAL": TICKET_GENERATOR_EXAMPLE_NEUTRAL,
+    "SLIGHTLY POSITIVE": TICKET_GENERATOR_EXAMPLE_SLIGHTLY_POSITIVE,
+    "POSITIVE": TICKET_GENERATOR_EXAMPLE_POSITIVE,
+}
+
 
 TICKET_GENERATOR_TEMPLATE = """
 ### Task:
@@ -159,7 +168,4 @@ TICKET_GENERATOR_TEMPLATE = """
 
 ### Examples:
 {examples}
-
-**Output Format**:
-{format_instructions}
 """
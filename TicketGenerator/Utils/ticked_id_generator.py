@@ -1,22 +1,30 @@
 import random
-from datetime import datetime
+from datetime import datetime, timezone
+
+# Date part of the ticket ID, refreshed only when the (UTC) day changes
+_DATE_CACHE = {"day": None, "str": ""}
 
 
 def generate_ticket_id():
     """
-    Generate a unique ticket ID in the format TKT-YYYYMMDD-XXXX
-    where XXXX is a random 4-digit number
+    Generate a unique ticket ID in the format TKT-YYYYMMDD-XXXXXXXX
+    where XXXXXXXX is a random 8-digit hex number (2^32 possible values per
+    day: the ID is the DynamoDB key, and a repeat would overwrite a ticket)
 
     Returns:
         str: Unique ticket ID
     """
-    # Get current date in YYYYMMDD format
-    date_part = datetime.now().strftime("%Y%m%d")
+    # Get current date in YYYYMMDD format (formatted once per day)
+    now = datetime.now(timezone.utc)
+    today = now.toordinal()
+    if today != _DATE_CACHE["day"]:
+        _DATE_CACHE["day"] = today
+        _DATE_CACHE["str"] = now.strftime("%Y%m%d")
 
-    # Generate random 4-digit number
-    random_part = random.randint(1000, 9999)
+    # Generate random 8-digit hex number
+    random_part = f"{random.getrandbits(32):08x}"
 
     # Combine to create ticket ID
-    ticket_id = f"TKT-{date_part}-{random_part}"
+    ticket_id = f"TKT-{_DATE_CACHE['str']}-{random_part}"
 
     return ticket_id
@@ -1,12 +1,10 @@
-from datetime import datetime
+import time
 
-def get_current_timestamp_str():
+def get_current_timestamp_ms():
     """
-    Get the current UTC timestamp as a formatted string without timezone info
+    Get the current UTC time as milliseconds since the Unix epoch
 
     Returns:
-        str: Current timestamp in ISO format without timezone info
+        int: Current epoch timestamp in milliseconds
     """
-    current_timestamp = datetime.utcnow()
-    current_timestamp_str = current_timestamp.isoformat()
-    return current_timestamp_str
+    return time.time_ns() // 1_000_000
@@ -1,28 +1,54 @@
+import argparse
+import asyncio
+import bisect
 import random
 import os
 import boto3
-import pickle
 import time
 import json
+import logging
+import orjson
+from botocore.config import Config
+from itertools import accumulate
 from dotenv import load_dotenv
 from langchain_aws import ChatBedrock
 from langchain_core.prompts import ChatPromptTemplate, PromptTemplate
+from langchain_core.runnables import RunnableBranch
 
 from IssueScenarios.issue_scenarios import issue_scenarios
 from Prompts.ticket_generator_prompts import *
-from Schemas.ticket_generator_output_parser import ticket_generator_output_parser
+from Schemas.ticket_generator_output_parser import TicketGeneratorOutput
 from Utils.ticked_id_generator import generate_ticket_id
-from Utils.timestamp import get_current_timestamp_str
-from pprint import pprint
+from Utils.timestamp import get_current_timestamp_ms
 
 load_dotenv(override=True)
 
+logging.basicConfig(level=os.getenv("LOG_LEVEL", "INFO"))
+log = logging.getLogger(__name__)
+
 # Load project name from environment variables
 project_name = os.getenv("PROJECT_NAME")
 
+# Default number of tickets to generate and max number of concurrent LLM calls
+NUM_TICKETS = 100
+MAX_CONCURRENCY = 16
+
+# Records are flushed to Kinesis in batches while generation is still running
+# (PutRecords accepts at most 500 records per call)
+KINESIS_BATCH_SIZE = 25
+KINESIS_MAX_RETRIES = 3
+
+# Generated ticket IDs and their target sentiment are appended here (one JSON per line)
+RESULTS_PATH = "Results/results.jsonl"
+
 # Initialize LLM with chosen model, temperature, and max token length
 llm = ChatBedrock(model_id="us.amazon.nova-lite-v1:0", temperature=0.7, max_tokens=500)
 
+# Milder tickets come out shorter, so they get a smaller decode budget
+# (model_copy keeps the same underlying bedrock-runtime client)
+short_llm = llm.model_copy(update={"max_tokens": 400})
+SHORT_TICKET_SENTIMENTS = frozenset({"NEUTRAL", "SLIGHTLY POSITIVE", "POSITIVE"})
+
 # Define sentiment weights (used to randomly assign a sentiment to the ticket)
 SENTIMENT_WEIGHTS = {
     "NEGATIVE": 0.22,
@@ -32,42 +58,18 @@ SENTIMENT_WEIGHTS = {
     "POSITIVE": 0.08
 }
 
-# Randomly select one sentiment based on weights
-sentiment = random.choices(
-    list(SENTIMENT_WEIGHTS.keys()),
-    weights=list(SENTIMENT_WEIGHTS.values()),
-    k=1
-)[0]
-
-# Randomly pick one issue scenario
-scenario = random.choice(issue_scenarios)
-
-# Debug info: print selected attributes
-print(f"Selected Sentiment: {sentiment}")
-print(f"Selected Product: {scenario.get('product')}")
-print(f"Selected Issue Type: {scenario.get('issue_type')}")
-print("\n")
-
-# Extract issue type
-issue_type = scenario.get("issue_type")
-
-# Format the task prompt with chosen sentiment, product, and issue type
-formatted_task = TICKET_GENERATOR_TASK.format(
-    sentiment=sentiment,
-    product=scenario.get("product"),
-    issue_type=issue_type,
-)
+# Sentiment keys and cumulative weights, sampled with bisect instead of random.choices
+SENTIMENT_KEYS = tuple(SENTIMENT_WEIGHTS)
+SENTIMENT_CUM_WEIGHTS = tuple(accumulate(SENTIMENT_WEIGHTS.values()))
+SENTIMENT_TOTAL_WEIGHT = SENTIMENT_CUM_WEIGHTS[-1]
 
-# Format guidelines with chosen sentiment
-formatted_guidelines = TICKET_GENERATOR_GUIDELINES.format(sentiment=sentiment)
+# Issue scenarios flattened into parallel tuples for index-based random picks
+SCENARIO_PRODUCTS = tuple(scenario["product"] for scenario in issue_scenarios)
+SCENARIO_ISSUE_TYPES = tuple(scenario["issue_type"] for scenario in issue_scenarios)
+NUM_SCENARIOS = len(SCENARIO_PRODUCTS)
 
-# Build the full prompt for the LLM
-prompt_text = PromptTemplate.from_template(TICKET_GENERATOR_TEMPLATE).format(
-    task=formatted_task,
-    guidelines=formatted_guidelines,
-    examples=TICKET_GENERATOR_EXAMPLES,
-    format_instructions=ticket_generator_output_parser.get_format_instructions(),
-)
+# Prompt template is the same for every ticket
+prompt_template = PromptTemplate.from_template(TICKET_GENERATOR_TEMPLATE)
 
 # Define system + human roles for the conversation
 prompt_messages = [
@@ -78,34 +80,199 @@ prompt_messages = [
     ),
 ]
 
-# Build LangChain pipeline: prompt → LLM → parser
+# Build LangChain pipeline: prompt → LLM with structured output (tool calling,
+# validated against TicketGeneratorOutput, no format instructions in the prompt)
+# Inputs with a short-ticket sentiment are routed to the smaller max_tokens LLM
 chat_prompt = ChatPromptTemplate.from_messages(prompt_messages)
-chain = chat_prompt | llm | ticket_generator_output_parser
-
-# Run the chain and get generated ticket response
-llm_response = chain.invoke({"prompt_text": prompt_text})
+chain = RunnableBranch(
+    (
+        lambda chain_input: chain_input["sentiment"] in SHORT_TICKET_SENTIMENTS,
+        chat_prompt | short_llm.with_structured_output(TicketGeneratorOutput),
+    ),
+    chat_prompt | llm.with_structured_output(TicketGeneratorOutput),
+)
 
-# Initialize Kinesis client
+# Initialize Kinesis client (pooled connections reused across calls, adaptive retries)
 kinesis = boto3.client(
     "kinesis",
-    region_name=os.getenv("AWS_REGION")
+    region_name=os.getenv("AWS_REGION"),
+    config=Config(
+        max_pool_connections=50,
+        retries={"mode": "adaptive", "max_attempts": 5},
+    ),
 )
 
-# Generate unique ticket ID and timestamp
-ticket_id = generate_ticket_id()
-submitted_at = get_current_timestamp_str()
+def build_prompts(n):
+    """
+    Build one prompt per ticket with a randomly chosen sentiment and issue scenario.
 
-# Build payload to send to Kinesis
-record_payload = {
-    "eventName": "TicketSubmitted",
-    "ticketId": ticket_id,
-    "submittedAt": submitted_at,
-    "data": llm_response['output']
-}
+    Args:
+        n (int): Number of tickets to build prompts for
 
-# Send record to Kinesis stream (partitioned by ticket_id)
-response = kinesis.put_record(
-    StreamName=f"{project_name}-kinesis-stream",
-    Data=json.dumps(record_payload).encode("utf-8"),
-    PartitionKey=ticket_id
-)
+    Returns:
+        tuple: (inputs, sentiments) - chain inputs ({"prompt_text": ..., "sentiment": ...}) and
+               the target sentiment of each input
+    """
+    inputs = []
+    sentiments = []
+    for _ in range(n):
+        # Randomly select one sentiment based on weights
+        sentiment = SENTIMENT_KEYS[
+            bisect.bisect(
+                SENTIMENT_CUM_WEIGHTS,
+                random.random() * SENTIMENT_TOTAL_WEIGHT,
+                0,
+                len(SENTIMENT_CUM_WEIGHTS) - 1,  # guard against float rounding at the top end
+            )
+        ]
+
+        # Randomly pick one issue scenario (product + issue type)
+        scenario_index = random.randrange(NUM_SCENARIOS)
+        product = SCENARIO_PRODUCTS[scenario_index]
+        issue_type = SCENARIO_ISSUE_TYPES[scenario_index]
+
+        # Debug info: selected attributes (formatted only when DEBUG is enabled)
+        log.debug("Selected sentiment %s, product %s, issue type %s", sentiment, product, issue_type)
+
+        # Format the task prompt with chosen sentiment, product, and issue type
+        formatted_task = TICKET_GENERATOR_TASK.format(
+            sentiment=sentiment,
+            product=product,
+            issue_type=issue_type,
+        )
+
+        # Format guidelines with chosen sentiment
+        formatted_guidelines = TICKET_GENERATOR_GUIDELINES.format(sentiment=sentiment)
+
+        # Build the full prompt for the LLM
+        prompt_text = prompt_template.format(
+            task=formatted_task,
+            guidelines=formatted_guidelines,
+            examples=TICKET_GENERATOR_EXAMPLES_BY_SENTIMENT[sentiment],
+        )
+        inputs.append({"prompt_text": prompt_text, "sentiment": sentiment})
+        sentiments.append(sentiment)
+
+    return inputs, sentiments
+
+
+def put_records_with_retry(batch, stream_name):
+    """
+    Send a batch of records to Kinesis, retrying only the records that failed.
+
+    Args:
+        batch (list): Kinesis records ({"Data": ..., "PartitionKey": ...}), at most 500
+        stream_name (str): Name of the target Kinesis stream
+
+    Raises:
+        RuntimeError: if some records still fail after KINESIS_MAX_RETRIES retries
+    """
+    for attempt in range(KINESIS_MAX_RETRIES + 1):
+        response = kinesis.put_records(
+            StreamName=stream_name,
+            Records=batch,
+        )
+        if response["FailedRecordCount"] == 0:
+            return
+
+        # Result entries are in request order; failed ones carry an ErrorCode
+        failed = [
+            (record, result["ErrorCode"])
+            for record, result in zip(batch, response["Records"])
+            if "ErrorCode" in result
+        ]
+        log.warning(
+            "%d records failed (%s), retrying...",
+            len(failed), ", ".join(sorted({code for _, code in failed})),
+        )
+        batch = [record for record, _ in failed]
+        time.sleep(0.1 * 2 ** attempt)
+
+    raise RuntimeError(f"Failed to put {len(batch)} records to Kinesis")
+
+
+async def generate_and_send_tickets(inputs, sentiments, stream_name):
+    """
+    Run the chain for all prompts concurrently and send each generated ticket
+    to Kinesis, flushing every KINESIS_BATCH_SIZE tickets as they complete.
+    Each ticket ID and its target sentiment is appended to RESULTS_PATH once
+    its batch has been put to Kinesis. A ticket whose generation fails is logged and
+    skipped, and the tickets already generated are still sent if the run stops.
+
+    Args:
+        inputs (list): Chain inputs ({"prompt_text": ..., "sentiment": ...}), one per ticket
+        sentiments (list): Target sentiment of each input
+        stream_name (str): Name of the target Kinesis stream
+    """
+    # Generated records with their results lines, waiting for the next flush
+    pending = []
+    with open(RESULTS_PATH, "a", encoding="utf-8") as results_file:
+
+        async def send_batch(batch):
+            # Send in a worker thread so in-flight LLM calls keep progressing; the
+            # results lines are only written once their records are in Kinesis
+            await asyncio.to_thread(put_records_with_retry, [record for record, _ in batch], stream_name)
+            results_file.writelines(line for _, line in batch)
+            results_file.flush()
+
+        try:
+            async for index, llm_response in chain.abatch_as_completed(
+                inputs, config={"max_concurrency": MAX_CONCURRENCY}, return_exceptions=True
+            ):
+                # A failed Bedrock call, or an answer without the tool call (None),
+                # only costs its own ticket instead of aborting the run
+                if llm_response is None or isinstance(llm_response, Exception):
+                    log.warning("Ticket %d was not generated: %r", index, llm_response)
+                    continue
+
+                # Generate unique ticket ID and timestamp
+                ticket_id = generate_ticket_id()
+                submitted_at = get_current_timestamp_ms()
+
+                # Build payload to send to Kinesis (partitioned by ticket_id)
+                record_payload = {
+                    "eventName": "TicketSubmitted",
+                    "ticketId": ticket_id,
+                    "submittedAt": submitted_at,
+                    "data": llm_response.output.model_dump()
+                }
+                pending.append((
+                    {
+                        "Data": orjson.dumps(record_payload),
+                        "PartitionKey": ticket_id,
+                    },
+                    json.dumps({"ticket_id": ticket_id, "sentiment_target": sentiments[index]}) + "\n",
+                ))
+
+                if len(pending) >= KINESIS_BATCH_SIZE:
+                    batch, pending = pending, []
+                    await send_batch(batch)
+        finally:
+            # Also reached when the run stops early: the tickets generated so far
+            # are not lost
+            if pending:
+                await send_batch(pending)
+
+
+def generate(n=1, stream_name=None):
+    """
+    Generate n tickets and send them to the Kinesis stream.
+
+    Args:
+        n (int): Number of tickets to generate
+        stream_name (str, optional): Target Kinesis stream, defaults to
+                                     "{PROJECT_NAME}-kinesis-stream"
+    """
+    stream_name = stream_name or f"{project_name}-kinesis-stream"
+    inputs, sentiments = build_prompts(n)
+    asyncio.run(generate_and_send_tickets(inputs, sentiments, stream_name))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate dummy support tickets and send them to Kinesis")
+    parser.add_argument("--n", type=int, default=NUM_TICKETS, help="Number of tickets to generate")
+    parser.add_argument("--stream-name", default=None, help="Kinesis stream name (defaults to {PROJECT_NAME}-kinesis-stream)")
+    cli_args = parser.parse_args()
+
+    # Generate tickets and send them to the Kinesis stream
+    generate(n=cli_args.n, stream_name=cli_args.stream_name)
@@ -1,15 +1,109 @@
+import json
+import os
+
 import aws_cdk as core
 import aws_cdk.assertions as assertions
+import pytest
 
 from ticket_management_system.ticket_management_system_stack import TicketManagementSystemStack
 
-# example tests. To run these tests, uncomment this file along with the example
-# resource in ticket_management_system/ticket_management_system_stack.py
-def test_sqs_queue_created():
+# Minimal configuration for a synth (values already in the environment or `.env` win)
+_TEST_ENV = {
+    "PROJECT_NAME": "Test",
+    "REDSHIFT_JDBC_CONNECTION_URL": "jdbc:redshift://example:5439/dev",
+    "REDSHIFT_ARN": "arn:aws:redshift:us-east-1:123456789012:cluster:example",
+    "REDSHIFT_IAM_ROLE_ARN": "arn:aws:iam::123456789012:role/redshift-copy",
+    "REDSHIFT_USERNAME": "user",
+    "REDSHIFT_PASSWORD": "password",
+    "REDSHIFT_DATABASE": "dev",
+    "REDSHIFT_SCHEMA": "public",
+    "REDSHIFT_TABLE": "processed_tickets",
+    "REDSHIFT_SUBNET_ID": "subnet-12345678",
+    "REDSHIFT_SECURITY_GROUP_ID": "sg-12345678",
+    "AVAILABILITY_ZONE": "us-east-1a",
+    "NOTIFICATION_EMAILS": "alerts@example.com",
+}
+
+
+@pytest.fixture(scope="module")
+def template():
+    for var, value in _TEST_ENV.items():
+        os.environ.setdefault(var, value)
     app = core.App()
-    stack = TicketManagementSystemStack(app, "ticket-management-system")
-    template = assertions.Template.from_stack(stack)
+    stack = TicketManagementSystemStack(
+        app,
+        "ticket-management-system",
+        env=core.Environment(account="123456789012", region="us-east-1"),
+    )
+    return assertions.Template.from_stack(stack)
+
+
+def test_sqs_queue_created(template):
+    # On-failure destination of the Kinesis trigger
+    template.has_resource_properties("AWS::SQS::Queue", {
+        "MessageRetentionPeriod": 14 * 24 * 3600,
+    })
+
+
+def test_kinesis_trigger_reports_and_keeps_failed_records(template):
+    template.has_resource_properties("AWS::Lambda::EventSourceMapping", {
+        "FunctionResponseTypes": ["ReportBatchItemFailures"],
+        "BisectBatchOnFunctionError": True,
+        "MaximumRetryAttempts": 5,
+        "MaximumRecordAgeInSeconds": 3600,
+        "DestinationConfig": {
+            "OnFailure": {
+                "Destination": {
+                    "Fn::GetAtt": [assertions.Match.string_like_regexp("TicketStreamFailures"), "Arn"]
+                }
+            }
+        },
+    })
+
+
+def test_kinesis_trigger_reads_through_efo_consumer(template):
+    template.has_resource_properties("AWS::Lambda::EventSourceMapping", {
+        "EventSourceArn": {"Fn::GetAtt": [assertions.Match.string_like_regexp("TicketStreamConsumer"), "ConsumerARN"]},
+    })
+    template.has_resource_properties("AWS::IAM::Role", {
+        "ManagedPolicyArns": assertions.Match.array_with([
+            {"Fn::Join": ["", ["arn:", {"Ref": "AWS::Partition"}, ":iam::aws:policy/service-role/AWSLambdaKinesisExecutionRole"]]},
+        ]),
+    })
+
+
+def test_state_machine_definition_fully_substituted(template):
+    (state_machine,) = template.find_resources("AWS::StepFunctions::StateMachine").values()
+    definition = state_machine["Properties"]["DefinitionString"]
+
+    # Literal JSON with a CDK token (resource ARN/name) in place of every placeholder
+    parts = definition["Fn::Join"][1] if isinstance(definition, dict) else [definition]
+    literal = "".join(part if isinstance(part, str) else "TOKEN" for part in parts)
+    assert "${" not in literal
+
+    asl = json.loads(literal)
+    assert asl["States"]["ResponseGenerator"]["Parameters"]["FunctionName"] == "TOKEN"
+    assert "States.Format('{}', $.ticket.submittedAt)" in literal
+
+
+def test_every_resource_destroyed_with_stack(template):
+    # _ForceDestroy has to reach L1 resources too (Glue job/trigger/connection,
+    # Kinesis consumer, event source mapping), not just the L2 constructs
+    resources = template.to_json()["Resources"]
+    retained = {
+        logical_id: resource["Type"]
+        for logical_id, resource in resources.items()
+        if resource.get("DeletionPolicy") != "Delete"
+    }
+    assert not retained
+    assert {"AWS::Glue::Job", "AWS::Glue::Trigger", "AWS::Glue::Connection", "AWS::Kinesis::StreamConsumer"} <= {
+        resource["Type"] for resource in resources.values()
+    }
+
 
-#     template.has_resource_properties("AWS::SQS::Queue", {
-#         "VisibilityTimeout": 300
-#     })
+def test_glue_job_copies_with_cluster_role(template):
+    template.has_resource_properties("AWS::Glue::Job", {
+        "DefaultArguments": assertions.Match.object_like({
+            "--REDSHIFT_IAM_ROLE": "arn:aws:iam::123456789012:role/redshift-copy",
+        }),
+    })
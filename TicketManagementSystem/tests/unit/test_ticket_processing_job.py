@@ -0,0 +1,48 @@
+import importlib.util
+import pathlib
+
+import pytest
+
+# Needs a local Spark (and the Glue libraries the job imports), e.g. the
+# amazon/aws-glue-libs image; skipped where they are not installed
+pytest.importorskip("pyspark")
+pytest.importorskip("awsglue")
+
+from pyspark.sql import SparkSession
+from pyspark.sql.types import TimestampType
+
+JOB_PATH = pathlib.Path(__file__).parents[2] / "ticket_management_system" / "glue_scripts" / "ticket_processing_job.py"
+
+
+@pytest.fixture(scope="module")
+def job():
+    spec = importlib.util.spec_from_file_location("ticket_processing_job", JOB_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture(scope="module")
+def spark():
+    session = (
+        SparkSession.builder.master("local[1]")
+        .appName("ticket-processing-job-tests")
+        .config("spark.sql.session.timeZone", "UTC")
+        .getOrCreate()
+    )
+    yield session
+    session.stop()
+
+
+def test_submitted_at_accepts_epoch_ms_and_iso_strings(job, spark):
+    # Newer tickets carry epoch milliseconds, older ones an ISO string (same instant here)
+    df = spark.createDataFrame(
+        [("1754686458524",), ("2025-08-08T20:54:18.524Z",), (None,)],
+        "submitted_at string",
+    )
+
+    casted = job.apply_schema_casting(df, [("submitted_at", TimestampType())])
+
+    assert dict(casted.dtypes) == {"submitted_at": "timestamp"}
+    seconds = [row[0] for row in casted.selectExpr("cast(submitted_at as double)").collect()]
+    assert seconds == [pytest.approx(1754686458.524), pytest.approx(1754686458.524), None]
@@ -0,0 +1,66 @@
+import base64
+import importlib.util
+import json
+import pathlib
+
+import pytest
+
+HANDLER_PATH = (
+    pathlib.Path(__file__).parents[2] / "ticket_management_system" / "lambdas" / "TriggerSFN" / "handler.py"
+)
+
+
+@pytest.fixture
+def handler(monkeypatch):
+    # The handler reads its configuration and creates its client at import time
+    monkeypatch.setenv("SFN_ARN", "arn:aws:states:us-east-1:123456789012:stateMachine:test")
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-1")
+    spec = importlib.util.spec_from_file_location("trigger_sfn_handler", HANDLER_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class _StubStepFunctions:
+    """Records the ticket of every start_execution call, failing for one of them."""
+
+    def __init__(self, failing_ticket=None):
+        self.failing_ticket = failing_ticket
+        self.started = []
+
+    def start_execution(self, stateMachineArn, input):
+        ticket = json.loads(input)["ticket"]["ticket_id"]
+        self.started.append(ticket)
+        if ticket == self.failing_ticket:
+            raise RuntimeError("ThrottlingException")
+
+
+def _records(n):
+    return [
+        {
+            "kinesis": {
+                "data": base64.b64encode(json.dumps({"ticket_id": i}).encode("utf-8")).decode("ascii"),
+                "sequenceNumber": f"4959{i:04d}",
+            }
+        }
+        for i in range(n)
+    ]
+
+
+def test_all_records_started(handler, monkeypatch):
+    sfn = _StubStepFunctions()
+    monkeypatch.setattr(handler, "sfn", sfn)
+
+    assert handler.lambda_handler({"Records": _records(6)}, None) == {"batchItemFailures": []}
+    assert sfn.started == [0, 1, 2, 3, 4, 5]
+
+
+def test_batch_stops_at_first_failed_record(handler, monkeypatch):
+    sfn = _StubStepFunctions(failing_ticket=3)
+    monkeypatch.setattr(handler, "sfn", sfn)
+
+    result = handler.lambda_handler({"Records": _records(6)}, None)
+
+    # Records after the failed one are redelivered by Lambda, so they must not start
+    assert sfn.started == [0, 1, 2, 3]
+    assert result == {"batchItemFailures": [{"itemIdentifier": "49590003"}]}
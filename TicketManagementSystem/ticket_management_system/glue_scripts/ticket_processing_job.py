@@ -1,9 +1,11 @@
 import sys
+import json
+from awsglue import gluetypes
 from awsglue.transforms import *
 from awsglue.utils import getResolvedOptions
+from pyspark import StorageLevel
 from pyspark.context import SparkContext
 from awsglue.context import GlueContext
-from awsglue.dynamicframe import DynamicFrame
 from awsglue.job import Job
 from pyspark.sql import functions as F
 from pyspark.sql.types import *
@@ -38,6 +40,32 @@ def get_ticket_schema():
         ("processed_at", TimestampType())
     ]
 
+def get_source_schema():
+    """
+    Define the raw schema of the ticket JSON objects written by S3Writer.
+    
+    Returns:
+        gluetypes.StructType: Field types as they appear in S3, passed to the
+                              reader so it can skip schema inference. submitted_at
+                              is read as a string: newer tickets carry epoch
+                              milliseconds and older ones an ISO string, and
+                              apply_schema_casting() converts both.
+    """
+    string_fields = [
+        "ticket_id", "customer_first_name", "customer_last_name", "customer_full_name",
+        "customer_email", "product", "issue_type", "subject", "description",
+        "sentiment", "response_text", "priority", "priority_reasoning",
+        "submitted_at", "processed_at"
+    ]
+    score_fields = [
+        "sentiment_score_mixed", "sentiment_score_negative",
+        "sentiment_score_neutral", "sentiment_score_positive"
+    ]
+    return gluetypes.StructType(
+        [gluetypes.Field(name, gluetypes.StringType()) for name in string_fields]
+        + [gluetypes.Field(name, gluetypes.DoubleType()) for name in score_fields]
+    )
+
 def read_tickets_from_s3(glue_context, s3_bucket):
     """
     Extract ticket JSON data from S3 bucket using AWS Glue.
@@ -48,7 +76,9 @@ def read_tickets_from_s3(glue_context, s3_bucket):
         
     Returns:
         DynamicFrame: Glue DynamicFrame containing all ticket records from
-                     s3://{bucket}/tickets/ with recursive file discovery
+                     s3://{bucket}/tickets/ with recursive file discovery.
+                     Read with the vectorized JSON reader and the explicit
+                     schema from get_source_schema() (no inference pass).
                      
     Raises:
         Exception: If S3 path is inaccessible or JSON format is invalid
@@ -56,13 +86,20 @@ def read_tickets_from_s3(glue_context, s3_bucket):
     s3_input_path = f"s3://{s3_bucket}/tickets/"
     
     return glue_context.create_dynamic_frame.from_options(
-        format_options={"multiline": False},
+        format_options={
+            "multiline": False,
+            "optimizePerformance": True,
+            "withSchema": json.dumps(get_source_schema().jsonValue())
+        },
         connection_type="s3",
         format="json",
         connection_options={
             "paths": [s3_input_path],
             "recurse": True,
-            "groupFiles": "inPartition"
+            # One small JSON object per ticket: read them in ~128 MB groups
+            # instead of one task per file
+            "groupFiles": "inPartition",
+            "groupSize": "134217728"
         },
         transformation_ctx="tickets_source"
     )
@@ -81,11 +118,29 @@ def apply_schema_casting(df, schema):
                   
     Note:
         Only casts columns that exist in the DataFrame. Missing columns are ignored.
+        All casts are applied in a single selectExpr projection built from SQL
+        strings, instead of one withColumn (and one new logical plan node) or
+        one py4j Column object per column. Timestamp strings made only of digits
+        are epoch milliseconds (e.g. submitted_at from newer tickets) and are
+        converted numerically, any other string is parsed as a timestamp.
     """
-    for col_name, col_type in schema:
-        if col_name in df.columns:
-            df = df.withColumn(col_name, F.col(col_name).cast(col_type))
-    return df
+    source_columns = set(df.columns)
+
+    def cast_expr(col_name, col_type):
+        type_name = col_type.simpleString()
+        if isinstance(col_type, TimestampType):
+            return (
+                f"case when `{col_name}` rlike '^[0-9]+$' "
+                f"then cast(cast(`{col_name}` as bigint) / 1000 as {type_name}) "
+                f"else cast(`{col_name}` as {type_name}) end as `{col_name}`"
+            )
+        return f"cast(`{col_name}` as {type_name}) as `{col_name}`"
+
+    return df.selectExpr(*[
+        cast_expr(col_name, col_type)
+        for col_name, col_type in schema
+        if col_name in source_columns
+    ])
 
 def validate_no_nulls(df, schema):
     """
@@ -96,7 +151,7 @@ def validate_no_nulls(df, schema):
         schema (list): Schema definition to check all required columns
         
     Returns:
-        bool: True if validation passes
+        int: Number of records checked (counted in the same aggregation)
         
     Raises:
         ValueError: If any column contains null values. Error message includes
@@ -107,26 +162,34 @@ def validate_no_nulls(df, schema):
                     columns: {'customer_name': 2, 'product': 3}"
     """
     print("Checking for null values...")
-    null_counts = {}
     
-    for col_name, _ in schema:
-        if col_name in df.columns:
-            null_count = df.filter(F.col(col_name).isNull()).count()
-            null_counts[col_name] = null_count
-            if null_count > 0:
-                print(f"Column '{col_name}' has {null_count} null values")
+    # Count rows and nulls for all columns in a single aggregation (one Spark job)
+    null_exprs = [
+        F.sum(F.col(col_name).isNull().cast("long")).alias(col_name)
+        for col_name, _ in schema
+        if col_name in df.columns
+    ]
+    counts = df.agg(F.count(F.lit(1)).alias("__record_count"), *null_exprs).collect()[0].asDict()
+    record_count = counts.pop("__record_count")
+    null_counts = {col_name: null_count or 0 for col_name, null_count in counts.items()}
+    
+    for col_name, null_count in null_counts.items():
+        if null_count > 0:
+            print(f"Column '{col_name}' has {null_count} null values")
     
     total_nulls = sum(null_counts.values())
     if total_nulls > 0:
+        null_counts = {col_name: count for col_name, count in null_counts.items() if count > 0}
         error_msg = f"Data quality check failed! Found {total_nulls} null values across columns: {null_counts}"
         raise ValueError(error_msg)
     
     print("All columns passed null validation ✓")
-    return True
+    return record_count
 
-def write_to_redshift(glue_context, df, connection_name, database, schema, table, temp_dir):
+def write_to_redshift(glue_context, df, connection_name, database, schema, table, temp_dir, iam_role):
     """
-    Load processed ticket data into Redshift table using JDBC connection.
+    Load processed ticket data into Redshift table using the Glue connection's
+    JDBC settings and the Spark Redshift connector (writes the DataFrame directly).
     
     Args:
         glue_context (GlueContext): AWS Glue context for Redshift operations
@@ -136,30 +199,43 @@ def write_to_redshift(glue_context, df, connection_name, database, schema, table
         schema (str): Redshift schema name
         table (str): Redshift table name
         temp_dir (str): S3 path for temporary staging during Redshift load
+        iam_role (str): ARN of the IAM role attached to the Redshift cluster that
+                        COPY reads the staged files with
         
     Raises:
         Exception: If Redshift connection fails, table doesn't exist, or
                   data type mismatches occur during insert operation
                   
     Note:
-        Uses COPY command via S3 staging for optimal performance.
+        Uses COPY command via S3 staging (gzipped CSV) for optimal performance.
+        Output is coalesced to at most 16 partitions so COPY loads a few larger
+        staged files instead of many tiny ones.
     """
-    processed_dyf = DynamicFrame.fromDF(df, glue_context, "processed_tickets")
+    target_partitions = max(1, min(16, df.rdd.getNumPartitions()))
+    df = df.coalesce(target_partitions)
+
+    # Credentials and URL come from the Glue connection (no DynamicFrame round-trip)
+    jdbc_conf = glue_context.extract_jdbc_conf(connection_name)
     
     # Construct fully qualified table name
     full_table_name = f"{schema}.{table}"
     
     print(f"Writing to Redshift table: {database}.{full_table_name}")
     
-    glue_context.write_dynamic_frame.from_jdbc_conf(
-        frame=processed_dyf,
-        catalog_connection=connection_name,
-        connection_options={
-            "dbtable": full_table_name,
-            "database": database
-        },
-        redshift_tmp_dir=temp_dir,
-        transformation_ctx="redshift_sink"
+    (
+        df.write.format("io.github.spark_redshift_community.spark.redshift")
+        .option("url", f"{jdbc_conf['url']}/{database}")
+        .option("user", jdbc_conf["user"])
+        .option("password", jdbc_conf["password"])
+        .option("dbtable", full_table_name)
+        .option("tempdir", temp_dir)
+        # Stage as gzipped CSV (fewer bytes than the default Avro) for the COPY
+        .option("tempformat", "CSV GZIP")
+        # COPY reads the staged files with the cluster's own IAM role (no
+        # credentials in the query text)
+        .option("aws_iam_role", iam_role)
+        .mode("append")
+        .save()
     )
 
 def process_tickets(args, glue_context):
@@ -186,59 +262,69 @@ def process_tickets(args, glue_context):
 
     # Read data from S3
     tickets_dyf = read_tickets_from_s3(glue_context, args['S3_BUCKET'])
-    record_count = tickets_dyf.count()
-    if record_count == 0:
-        print("No tickets to process")
-        return
     
-    # Convert to DataFrame and apply transformations
+    # Convert to DataFrame and spread the grouped input across all executor
+    # cores before the casting/validation stages
     tickets_df = tickets_dyf.toDF()
+    tickets_df = tickets_df.repartition(glue_context.spark_session.sparkContext.defaultParallelism * 2)
     tickets_df = apply_schema_casting(tickets_df, schema)
     
-    # Validate data quality
-    validate_no_nulls(tickets_df, schema)
-    
-    print(f"Records to process: {tickets_df.count()}")
-    
-    # Write to Redshift
-    print("Writing to Redshift...")
-    write_to_redshift(
-        glue_context=glue_context,
-        df=tickets_df,
-        connection_name=args['REDSHIFT_CONNECTION'],
-        database=args['REDSHIFT_DATABASE'],
-        schema=args['REDSHIFT_SCHEMA'],
-        table=args['REDSHIFT_TABLE'],
-        temp_dir=args['TEMP_DIR']
-    )
+    # Materialize once so validation and write don't re-read S3
+    tickets_df = tickets_df.persist(StorageLevel.MEMORY_AND_DISK)
+    try:
+        # Validate data quality (the same pass also counts the records)
+        record_count = validate_no_nulls(tickets_df, schema)
+        if record_count == 0:
+            print("No tickets to process")
+            return
+        
+        print(f"Records to process: {record_count}")
+        
+        # Write to Redshift
+        print("Writing to Redshift...")
+        write_to_redshift(
+            glue_context=glue_context,
+            df=tickets_df,
+            connection_name=args['REDSHIFT_CONNECTION'],
+            database=args['REDSHIFT_DATABASE'],
+            schema=args['REDSHIFT_SCHEMA'],
+            table=args['REDSHIFT_TABLE'],
+            temp_dir=args['TEMP_DIR'],
+            iam_role=args['REDSHIFT_IAM_ROLE']
+        )
+    finally:
+        tickets_df.unpersist()
     
-    print(f"Successfully processed {tickets_df.count()} tickets to {args['REDSHIFT_SCHEMA']}.{args['REDSHIFT_TABLE']}")
-
+    print(f"Successfully processed {record_count} tickets to {args['REDSHIFT_SCHEMA']}.{args['REDSHIFT_TABLE']}")
 
-args = getResolvedOptions(sys.argv, [
-    'JOB_NAME', 
-    'S3_BUCKET', 
-    'REDSHIFT_DATABASE',
-    'REDSHIFT_SCHEMA',
-    'REDSHIFT_TABLE',
-    'REDSHIFT_CONNECTION',
-    'TEMP_DIR'
-])
+# Job entry point (Glue runs the script as __main__; importing it only defines
+# the functions above)
+if __name__ == "__main__":
+    args = getResolvedOptions(sys.argv, [
+        'JOB_NAME', 
+        'S3_BUCKET', 
+        'REDSHIFT_DATABASE',
+        'REDSHIFT_SCHEMA',
+        'REDSHIFT_TABLE',
+        'REDSHIFT_CONNECTION',
+        'REDSHIFT_IAM_ROLE',
+        'TEMP_DIR'
+    ])
 
-# Initialize Glue context
-sc = SparkContext()
-glue_context = GlueContext(sc)
-spark = glue_context.spark_session
-job = Job(glue_context)
-job.init(args['JOB_NAME'], args)
+    # Initialize Glue context
+    sc = SparkContext()
+    glue_context = GlueContext(sc)
+    spark = glue_context.spark_session
+    job = Job(glue_context)
+    job.init(args['JOB_NAME'], args)
 
-print(f"Starting job: {args['JOB_NAME']}")
+    print(f"Starting job: {args['JOB_NAME']}")
 
-try:
-    process_tickets(args, glue_context)
-except Exception as e:
-    print(f"Error processing tickets: {str(e)}")
-    raise e
-finally:
-    job.commit()
-    print("Job completed successfully")
\ No newline at end of file
+    try:
+        process_tickets(args, glue_context)
+    except Exception as e:
+        print(f"Error processing tickets: {str(e)}")
+        raise e
+    finally:
+        job.commit()
+        print("Job completed successfully")
\ No newline at end of file
@@ -1,13 +1,68 @@
 from Prompts.response_generator_prompts import (
     RESPONSE_GENERATOR_TASK,
     RESPONSE_GENERATOR_GUIDELINES,
-    RESPONSE_GENERATOR_EXAMPLES,
+    RESPONSE_GENERATOR_EXAMPLES_BY_PRIORITY,
     RESPONSE_GENERATOR_TEMPLATE,
+    RESPONSE_GENERATOR_STATIC_CONTEXT,
     RESPONSE_GENERATOR_SYSTEM_ROLE,
 )
-from langchain_core.prompts import PromptTemplate, ChatPromptTemplate
-from langchain_aws import ChatBedrock
-from Schemas.response_generator_output_parser import response_generator_output_parser
+from langchain_core.prompts import PromptTemplate
+from functools import lru_cache
+import boto3
+import orjson
+
+from Schemas.response_generator_output_parser import (
+    format_instructions,
+    parse_response_output,
+)
+
+# Per-ticket prompt scaffold, parsed once per container
+PROMPT_TEMPLATE = PromptTemplate.from_template(RESPONSE_GENERATOR_TEMPLATE)
+
+# Static system prefix (role, one example, format instructions) followed by a
+# cache point, so Bedrock caches it instead of re-processing it on every call.
+# One prefix per example priority, each of them identical across calls.
+SYSTEM_BLOCKS_BY_PRIORITY = {
+    priority: [
+        {"text": RESPONSE_GENERATOR_SYSTEM_ROLE},
+        {
+            "text": RESPONSE_GENERATOR_STATIC_CONTEXT.format(
+                examples=example,
+                format_instructions=format_instructions(),
+            )
+        },
+        {"cachePoint": {"type": "default"}},
+    ]
+    for priority, example in RESPONSE_GENERATOR_EXAMPLES_BY_PRIORITY.items()
+}
+
+# Issue types that usually mean something is broken rather than misconfigured
+HIGH_IMPACT_ISSUE_KEYWORDS = ("failure", "outage", "down", "connectivity", "unavailable")
+
+
+@lru_cache(maxsize=256)
+def select_example_priority(sentiment: str, issue_type: str) -> str:
+    """
+    Cheap guess of the ticket priority, only used to pick which example to send.
+    The model still classifies the final priority from the full guidelines.
+    """
+    if sentiment == "POSITIVE":
+        return "NORMAL"
+    if sentiment == "NEGATIVE" or any(
+        keyword in issue_type.lower() for keyword in HIGH_IMPACT_ISSUE_KEYWORDS
+    ):
+        return "HIGH"
+    return "MEDIUM"
+
+
+@lru_cache(maxsize=1024)
+def format_guidelines(company: str, product: str, issue_type: str) -> str:
+    """Guidelines only depend on these three fields, which repeat across tickets."""
+    return RESPONSE_GENERATOR_GUIDELINES.format(
+        company=company,
+        product=product,
+        issue_type=issue_type,
+    )
 
 
 class TicketResponseGenerator:
@@ -21,16 +76,17 @@ class TicketResponseGenerator:
         temperature: float = 0.7,
         max_tokens: int = 1000,
     ):
-        # Initialize the Bedrock LLM client
-        self.llm = ChatBedrock(
-            model_id=model_id,
-            temperature=temperature,
-            max_tokens=max_tokens,
-        )
+        # Initialize the Bedrock runtime client (called directly, no LangChain chain)
+        self.model_id = model_id
+        self.bedrock = boto3.client("bedrock-runtime")
+
+        # Static parts of the Nova request body, built once per container
+        self.inference_config = {"maxTokens": max_tokens, "temperature": temperature}
 
     def format_prompt(self, **kwargs) -> str:
         """
-        Formats the system task, guidelines, and examples into a single prompt text.
+        Formats the ticket-specific task and guidelines into the user prompt text
+        (the example and format instructions live in the cached system prefix).
 
         Expects flat keyword arguments:
         - subject: str
@@ -40,7 +96,6 @@ class TicketResponseGenerator:
         - sentiment: str = "NEUTRAL"
         - product: str
         - issue_type: str
-        - ticket_id: str
 
         Returns:
             A fully formatted prompt string ready for the LLM.
@@ -52,7 +107,6 @@ class TicketResponseGenerator:
         sentiment = kwargs.get("sentiment", "NEUTRAL")
         product = kwargs.get("product", "")
         issue_type = kwargs.get("issue_type", "")
-        ticket_id = kwargs.get("ticket_id", "")
 
         formatted_task = RESPONSE_GENERATOR_TASK.format(
             subject=subject,
@@ -63,26 +117,17 @@ class TicketResponseGenerator:
             product=product,
             issue_type=issue_type,
         )
-        formatted_guidelines = RESPONSE_GENERATOR_GUIDELINES.format(
-            company=company,
-            product=product,
-            issue_type=issue_type,
-        )
-        formatted_examples = RESPONSE_GENERATOR_EXAMPLES.format(
-            ticket_id=ticket_id
-        )
+        formatted_guidelines = format_guidelines(company, product, issue_type)
 
-        prompt_text = PromptTemplate.from_template(RESPONSE_GENERATOR_TEMPLATE).format(
+        prompt_text = PROMPT_TEMPLATE.format(
             task=formatted_task,
             guidelines=formatted_guidelines,
-            examples=formatted_examples,
-            format_instructions=response_generator_output_parser.get_format_instructions(),
         )
         return prompt_text
 
     def generate_response(self, **kwargs) -> str:
         """
-        Builds the chat prompt, invokes the LLM, and parses the output.
+        Formats the prompt, invokes the model through bedrock-runtime, and parses the output.
 
         Accepts the same kwargs as format_prompt.
 
@@ -90,20 +135,18 @@ class TicketResponseGenerator:
             The generated ticket response text.
         """
         prompt_text = self.format_prompt(**kwargs)
-        # Prepare chat messages
-        prompt_messages = [
-            ("system", RESPONSE_GENERATOR_SYSTEM_ROLE),
-            (
-                "human",
-                [{"type": "text", "text": "{prompt_text}"}],
-            ),
-        ]
-        # Create a chat prompt template
-        chat_prompt = ChatPromptTemplate.from_messages(prompt_messages)
-
-        # Compose the chain: prompt -> llm -> parser
-        chain = chat_prompt | self.llm | response_generator_output_parser
-        result = chain.invoke({"prompt_text": prompt_text})
+        example_priority = select_example_priority(
+            kwargs.get("sentiment") or "NEUTRAL", kwargs.get("issue_type") or ""
+        )
+        body = {
+            "schemaVersion": "messages-v1",
+            "system": SYSTEM_BLOCKS_BY_PRIORITY[example_priority],
+            "messages": [{"role": "user", "content": [{"text": prompt_text}]}],
+            "inferenceConfig": self.inference_config,
+        }
+        response = self.bedrock.invoke_model(modelId=self.model_id, body=orjson.dumps(body))
+        output_text = orjson.loads(response["body"].read())["output"]["message"]["content"][0]["text"]
+        result = parse_response_output(output_text)
 
         # Extract and return the response
-        return result["output"]
\ No newline at end of file
+        return result["output"]
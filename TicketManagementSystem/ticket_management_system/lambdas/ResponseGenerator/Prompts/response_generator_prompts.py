@@ -128,7 +128,7 @@ INFORMATION GATHERING
 • Specify format for sharing information (screenshots, logs, etc.)
 """
 
-RESPONSE_GENERATOR_EXAMPLES = """
+RESPONSE_GENERATOR_EXAMPLE_HIGH = """
 --- HIGH PRIORITY EXAMPLE ---
 Subject: RDS Database completely down - production outage
 Sentiment: NEGATIVE
@@ -155,7 +155,9 @@ Ticket TKT-12345
 
 Priority: HIGH
 Priority Reasoning: Production database outage with negative sentiment indicates complete service failure requiring immediate attention
+"""
 
+RESPONSE_GENERATOR_EXAMPLE_MEDIUM = """
 --- MEDIUM PRIORITY EXAMPLE ---
 Subject: Lambda functions timing out after deployment
 Sentiment: MIXED
@@ -182,7 +184,9 @@ Ticket TKT-67890
 
 Priority: MEDIUM
 Priority Reasoning: Mixed sentiment with technical issue affecting functionality requires standard escalation
+"""
 
+RESPONSE_GENERATOR_EXAMPLE_NORMAL = """
 --- NORMAL PRIORITY EXAMPLE ---
 Subject: Question about EC2 cost optimization
 Sentiment: POSITIVE
@@ -211,6 +215,24 @@ Priority: NORMAL
 Priority Reasoning: Positive sentiment with optimization question indicates non-urgent informational request
 """
 
+# Only the example matching the expected priority is sent with each ticket
+RESPONSE_GENERATOR_EXAMPLES_BY_PRIORITY = {
+    "HIGH": RESPONSE_GENERATOR_EXAMPLE_HIGH,
+    "MEDIUM": RESPONSE_GENERATOR_EXAMPLE_MEDIUM,
+    "NORMAL": RESPONSE_GENERATOR_EXAMPLE_NORMAL,
+}
+
+# ---------------- STATIC CONTEXT -------------------------------
+# Identical for every ticket: sent in the system block ahead of a Bedrock
+# cache point so the prefix is cached instead of re-processed per call
+RESPONSE_GENERATOR_STATIC_CONTEXT = """
+### Examples:
+{examples}
+
+**Output Format**:
+{format_instructions}
+"""
+
 # ---------------- TEMPLATE WRAPPER -----------------------------
 RESPONSE_GENERATOR_TEMPLATE = """
 ### Task:
@@ -219,11 +241,5 @@ RESPONSE_GENERATOR_TEMPLATE = """
 ### Guidelines:
 {guidelines}
 
-### Examples:
-{examples}
-
-**Output Format**:
-{format_instructions}
-
 Generate an initial response following this structure and tone guidance.
 """
\ No newline at end of file
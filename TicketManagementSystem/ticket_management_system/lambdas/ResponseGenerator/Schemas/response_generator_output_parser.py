@@ -1,6 +1,9 @@
+import re
+from functools import cache
 from typing import Dict, List, Optional
 from langchain_core.output_parsers import JsonOutputParser
 from pydantic import BaseModel, Field
+import orjson
 
 
 # Response Generator Content Model
@@ -14,4 +17,26 @@ class ResponseGeneratorOutput(BaseModel):
     output: ResponseGeneratorContentDict
 
 
-response_generator_output_parser = JsonOutputParser(pydantic_object=ResponseGeneratorOutput)
\ No newline at end of file
+response_generator_output_parser = JsonOutputParser(pydantic_object=ResponseGeneratorOutput)
+
+
+@cache
+def format_instructions() -> str:
+    """Format instructions for the response schema, built once per Lambda container."""
+    return response_generator_output_parser.get_format_instructions()
+
+
+# Outermost {...} in the model text (skips markdown fences and any preamble)
+_JSON_OBJECT = re.compile(r"\{.*\}", re.S)
+
+
+def parse_response_output(text: str) -> dict:
+    """
+    Fast parser for the fixed response shape: regex out the JSON object and load it with orjson.
+
+    The Pydantic model above is only used to generate the format instructions.
+    """
+    match = _JSON_OBJECT.search(text)
+    if match is None:
+        raise ValueError(f"No JSON object found in model output: {text[:200]!r}")
+    return orjson.loads(match.group(0))
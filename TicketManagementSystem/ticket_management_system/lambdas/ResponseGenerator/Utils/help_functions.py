@@ -6,11 +6,12 @@ def extract_ticket_info(event: dict) -> dict:
             subject, description, customer_name, company,
             sentiment, product, issue_type, ticket_id
     """
-    ticket = event.get("ticket", {})
-    data = ticket.get("data", {})
-    contact = data.get("customer_contact_information", {})
-    prod_info = data.get("product_issue_information", {})
-    comp_result = event.get("ComprehendResult", {})
+    # `or {}` only falls back (and allocates) when a level is missing or null
+    ticket = event.get("ticket") or {}
+    data = ticket.get("data") or {}
+    contact = data.get("customer_contact_information") or {}
+    prod_info = data.get("product_issue_information") or {}
+    comp_result = event.get("ComprehendResult") or {}
 
     return {
         "subject": data.get("subject"),
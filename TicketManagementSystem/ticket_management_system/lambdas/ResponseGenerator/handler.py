@@ -1,7 +1,11 @@
+import os
 from Utils.help_functions import extract_ticket_info
 from Model.response_generator import TicketResponseGenerator
 
-response_generator = TicketResponseGenerator()
+# Same model the execution role is scoped to (set by the stack)
+response_generator = TicketResponseGenerator(
+    model_id=os.environ.get("BEDROCK_MODEL_ID", "us.amazon.nova-pro-v1:0")
+)
 
 def lambda_handler(event, context):
     try:
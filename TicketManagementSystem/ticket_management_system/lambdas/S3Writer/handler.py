@@ -1,60 +1,76 @@
 import boto3
+import gzip
 import json
 import os
+from botocore.config import Config
 from datetime import datetime
 
-s3 = boto3.client('s3')
+# Keep the connection alive across warm invocations, retry throttles adaptively
+s3 = boto3.client(
+    's3',
+    config=Config(tcp_keepalive=True, retries={'mode': 'adaptive', 'max_attempts': 5})
+)
 
 def lambda_handler(event, context):
     bucket_name = os.environ['S3_BUCKET_NAME']
     
     try:
         # Extract data from Step Functions payload
-        ticket_data = event.get('ticket', {})
-        comprehend_result = event.get('ComprehendResult', {})
-        response_generator = event.get('ResponseGenerator', {}).get('Payload', {})
+        ticket_data = event.get('ticket') or {}
+        comprehend_result = event.get('ComprehendResult') or {}
+        response_generator = (event.get('ResponseGenerator') or {}).get('Payload') or {}
+
+        # Bind the nested levels once instead of walking them for every field
+        data = ticket_data.get('data') or {}
+        contact = data.get('customer_contact_information') or {}
+        product_issue = data.get('product_issue_information') or {}
+        scores = comprehend_result.get('SentimentScore') or {}
 
         processed_at_dt = datetime.utcnow()
         processed_at_str = processed_at_dt.isoformat()
+        date_prefix = processed_at_dt.strftime('tickets/%Y/%m/%d')
+        ticket_id = ticket_data.get('ticketId')
 
         # Transform to clean JSON structure with flattened sentiment scores
         transformed_ticket = {
-            'ticket_id': ticket_data.get('ticketId'),
+            'ticket_id': ticket_id,
             'submitted_at': ticket_data.get('submittedAt'),
-            'customer_first_name': ticket_data.get('data', {}).get('customer_contact_information', {}).get('first_name'),
-            'customer_last_name': ticket_data.get('data', {}).get('customer_contact_information', {}).get('last_name'),
-            'customer_full_name': ticket_data.get('data', {}).get('customer_contact_information', {}).get('full_name'),
-            'customer_email': ticket_data.get('data', {}).get('customer_contact_information', {}).get('email'),
-            'product': ticket_data.get('data', {}).get('product_issue_information', {}).get('product'),
-            'issue_type': ticket_data.get('data', {}).get('product_issue_information', {}).get('issue_type'),
-            'subject': ticket_data.get('data', {}).get('subject'),
-            'description': ticket_data.get('data', {}).get('description'),
+            'customer_first_name': contact.get('first_name'),
+            'customer_last_name': contact.get('last_name'),
+            'customer_full_name': contact.get('full_name'),
+            'customer_email': contact.get('email'),
+            'product': product_issue.get('product'),
+            'issue_type': product_issue.get('issue_type'),
+            'subject': data.get('subject'),
+            'description': data.get('description'),
             'response_text': response_generator.get('response'),
             'sentiment': comprehend_result.get('Sentiment'),
-            'sentiment_score_mixed': comprehend_result.get('SentimentScore', {}).get('Mixed', 0),
-            'sentiment_score_negative': comprehend_result.get('SentimentScore', {}).get('Negative', 0),
-            'sentiment_score_neutral': comprehend_result.get('SentimentScore', {}).get('Neutral', 0),
-            'sentiment_score_positive': comprehend_result.get('SentimentScore', {}).get('Positive', 0),
+            'sentiment_score_mixed': scores.get('Mixed', 0),
+            'sentiment_score_negative': scores.get('Negative', 0),
+            'sentiment_score_neutral': scores.get('Neutral', 0),
+            'sentiment_score_positive': scores.get('Positive', 0),
             'priority': response_generator.get('priority'),
             'priority_reasoning': response_generator.get('priority_reasoning'),
             'processed_at': processed_at_str
         }
 
-        s3_key = f"tickets/{processed_at_dt.year}/{processed_at_dt.month:02d}/{processed_at_dt.day:02d}/ticket_{transformed_ticket['ticket_id']}.json"
+        s3_key = f"{date_prefix}/ticket_{ticket_id}.json.gz"
         
         # Save to S3
         s3.put_object(
             Bucket=bucket_name,
             Key=s3_key,
-            Body=json.dumps(transformed_ticket, indent=2),
-            ContentType='application/json'
+            # Compact, one line per ticket, gzipped (Glue picks the codec from the .gz suffix)
+            Body=gzip.compress(json.dumps(transformed_ticket, separators=(',', ':')).encode('utf-8')),
+            ContentType='application/json',
+            ContentEncoding='gzip'
         )
         
-        print(f"Successfully saved ticket {transformed_ticket['ticket_id']} to S3: {s3_key}")
+        print(f"Successfully saved ticket {ticket_id} to S3: {s3_key}")
         
         return {
             'statusCode': 200,
-            'ticket_id': transformed_ticket['ticket_id'],
+            'ticket_id': ticket_id,
             's3_location': f"s3://{bucket_name}/{s3_key}",
             'message': 'Ticket successfully saved to S3'
         }
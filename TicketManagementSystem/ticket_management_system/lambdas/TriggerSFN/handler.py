@@ -1,31 +1,34 @@
 import base64
 import json
+import logging
 import os
 import boto3
 
+log = logging.getLogger(__name__)
+
 sfn = boto3.client("stepfunctions")
 SFN_ARN = os.environ["SFN_ARN"]
 
-def lambda_handler(event, context):
-    try:
-        # Process each record from the Kinesis stream
-        for record in event["Records"]:
-            # Decode the Kinesis data payload (it's base64 encoded)
-            payload = base64.b64decode(record["kinesis"]["data"]).decode("utf-8")
-            data = json.loads(payload)
-            
-            # Start Step Functions execution
-            sfn.start_execution(
-                stateMachineArn=SFN_ARN,
-                input=json.dumps({"ticket": data})
-            )
+def start_execution(record):
+    # Decode the Kinesis data payload (base64 encoded) and start a Step Functions
+    # execution for the ticket
+    ticket = json.loads(base64.b64decode(record["kinesis"]["data"]).decode("utf-8"))
+    sfn.start_execution(
+        stateMachineArn=SFN_ARN,
+        input=json.dumps({"ticket": ticket})
+    )
 
-    except Exception as e:
-        # Log and raise error to make Lambda fail
-        print(f"Error processing records: {str(e)}")
-        raise
+def lambda_handler(event, context):
+    # Records are started in order and the batch stops at the first failure:
+    # Lambda resumes the shard from the reported sequence number, so every
+    # record after it is redelivered and must not have been started yet
+    # (express executions are not de-duplicated)
+    for record in event["Records"]:
+        try:
+            start_execution(record)
+        except Exception:
+            sequence_number = record["kinesis"]["sequenceNumber"]
+            log.exception("Error processing record %s", sequence_number)
+            return {"batchItemFailures": [{"itemIdentifier": sequence_number}]}
 
-    return {
-        "statusCode": 200,
-        "body": json.dumps("Lambda processed Kinesis event successfully."),
-    }
+    return {"batchItemFailures": []}
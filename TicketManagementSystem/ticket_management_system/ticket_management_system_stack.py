@@ -1,28 +1,135 @@
+import functools
+import json
 import os
 import pathlib
+import re
+from graphlib import TopologicalSorter
 
+import jsii
 from aws_cdk import (
+    AssetHashType,
+    Aspects,
+    CfnResource,
+    IAspect,
     Stack,
     Duration,
     RemovalPolicy,
     aws_kinesis as kinesis,
     aws_lambda as _lambda,
+    aws_logs as logs,
+    aws_ecr_assets as ecr_assets,
     aws_iam as iam,
     aws_stepfunctions as sfn,
     aws_dynamodb as dynamodb,
     aws_s3 as s3,
     aws_sns as sns,
     aws_sns_subscriptions as subs,
+    aws_sqs as sqs,
     aws_glue as glue,
-    aws_events as events,
-    aws_events_targets as targets,
-    aws_s3_deployment as s3deploy,
+    aws_s3_assets as s3_assets,
     aws_cloudwatch as cloudwatch,
     aws_cloudwatch_actions as cw_actions
 )
 from aws_cdk.aws_lambda import CfnEventSourceMapping
 from constructs import Construct
-from dotenv import load_dotenv
+from dotenv import dotenv_values, find_dotenv
+
+# Required environment variables and the stack attributes they are assigned to
+_REQUIRED_ENV_PARAMS = {
+    "REDSHIFT_JDBC_CONNECTION_URL": "redshift_jdbc_url",
+    "REDSHIFT_ARN": "redshift_arn",
+    "REDSHIFT_IAM_ROLE_ARN": "redshift_iam_role_arn",
+    "REDSHIFT_USERNAME": "redshift_username",
+    "REDSHIFT_PASSWORD": "redshift_password",
+    "REDSHIFT_DATABASE": "redshift_database",
+    "REDSHIFT_SCHEMA": "redshift_schema",
+    "REDSHIFT_TABLE": "redshift_table",
+    "REDSHIFT_SUBNET_ID": "redshift_subnet_id",
+    "REDSHIFT_SECURITY_GROUP_ID": "redshift_security_group_id",
+    "AVAILABILITY_ZONE": "availability_zone",
+}
+
+# Glue JDBC connection property -> stack attribute holding its value
+_REDSHIFT_CONN_PROPERTIES = (
+    ("JDBC_CONNECTION_URL", "redshift_jdbc_url"),
+    ("USERNAME", "redshift_username"),
+    ("PASSWORD", "redshift_password"),
+)
+
+# Loose sanity check for NOTIFICATION_EMAILS entries (SNS does the real validation)
+_EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
+# Kinesis event filter: only TicketSubmitted records invoke the trigger Lambda
+# (for Kinesis sources the decoded JSON payload is matched under "data")
+_TICKET_FILTER_PATTERN = json.dumps({"data": {"eventName": ["TicketSubmitted"]}}, separators=(",", ":"))
+
+# Local build/test artifacts kept out of the Lambda assets, so they neither get
+# hashed and zipped on every synth nor change the asset hash when regenerated
+_ASSET_EXCLUDE = ["__pycache__", "*.pyc", "tests/*", ".pytest_cache", "*.egg-info"]
+
+# `.env` merged under the process environment, read from disk once per process
+_ENV_CACHE = None
+
+
+def _env() -> dict:
+    global _ENV_CACHE
+    if _ENV_CACHE is None:
+        _ENV_CACHE = {**dotenv_values(find_dotenv()), **os.environ}
+    return _ENV_CACHE
+
+
+@functools.lru_cache(maxsize=1)
+def _asl_definition() -> dict:
+    """State machine ASL template, read and parsed once per process (never mutated)."""
+    return json.loads(
+        (pathlib.Path(__file__).parent / "state_machine" / "state_machine.json").read_text(encoding="utf-8")
+    )
+
+
+def _substitute(node, values: dict):
+    """
+    Returns a copy of the parsed ASL with every "${Name}" string replaced by
+    values["Name"] (a CDK token), so no deploy-time substitution is needed.
+    """
+    if isinstance(node, dict):
+        return {key: _substitute(value, values) for key, value in node.items()}
+    if isinstance(node, list):
+        return [_substitute(value, values) for value in node]
+    if isinstance(node, str) and node.startswith("${") and node.endswith("}"):
+        return values.get(node[2:-1], node)
+    return node
+
+
+@functools.lru_cache(maxsize=None)
+def _managed(name: str) -> iam.IManagedPolicy:
+    """AWS managed policy reference, shared by every role (and stack) that attaches it."""
+    return iam.ManagedPolicy.from_aws_managed_policy_name(name)
+
+
+def _lambda_code(path: str) -> _lambda.Code:
+    """
+    Lambda asset for `path`. When LAMBDA_HASH is set (e.g. the git tree SHA of
+    the lambdas directory on CI), it is used as the asset hash instead of
+    hashing every file on each synth; the path keeps the three hashes distinct.
+    """
+    lambda_hash = _env().get("LAMBDA_HASH")
+    if not lambda_hash:
+        return _lambda.Code.from_asset(path, asset_hash_type=AssetHashType.SOURCE, exclude=_ASSET_EXCLUDE)
+    return _lambda.Code.from_asset(
+        path,
+        exclude=_ASSET_EXCLUDE,
+        asset_hash_type=AssetHashType.CUSTOM,
+        asset_hash=f"{lambda_hash}:{path}",
+    )
+
+@jsii.implements(IAspect)
+class _ForceDestroy:
+    """Applies `RemovalPolicy.DESTROY` to every CloudFormation resource in a scope."""
+
+    def visit(self, node) -> None:
+        if isinstance(node, CfnResource):
+            node.apply_removal_policy(RemovalPolicy.DESTROY)
+
 
 class TicketManagementSystemStack(Stack):
     """
@@ -34,7 +141,7 @@ class TicketManagementSystemStack(Stack):
       3. DynamoDB table → ticket metadata
       4. S3 bucket → ticket data and generated responses
       5. SNS topic → notifications and alarms
-      6. AWS Glue job + EventBridge → ETL into Redshift
+      6. AWS Glue job + scheduled trigger → ETL into Redshift
       7. Step Functions state machine → orchestration of ticket workflow
       8. CloudWatch alarm → failure monitoring
 
@@ -44,24 +151,49 @@ class TicketManagementSystemStack(Stack):
     - All resources use `RemovalPolicy.DESTROY` for easy cleanup in dev/thesis envs.
     """
 
+    # Runtime and timeouts shared by the zip-packaged Lambda functions
+    # (the ResponseGenerator is a container image, see its Dockerfile)
+    _PY312 = _lambda.Runtime.PYTHON_3_12
+    _ARM = _lambda.Architecture.ARM_64
+    _T30S = Duration.seconds(30)
+    _T60S = Duration.seconds(60)
+
+    # Provisioning steps and the steps whose resources they reference
+    _STEPS = {
+        "_create_kinesis_stream": set(),
+        "_create_lambda_role": set(),
+        "_create_event_trigger_lambda": {"_create_kinesis_stream", "_create_lambda_role"},
+        "_create_response_generator_lambda": {"_create_lambda_role"},
+        "_create_dynamodb_table": set(),
+        "_create_s3_bucket": {"_create_lambda_role"},
+        "_create_s3_writer_lambda": {"_create_s3_bucket", "_create_lambda_role"},
+        "_create_sns_topic": set(),
+        "_create_glue_job_and_schedule": {"_create_s3_bucket"},
+        "_create_step_function": {
+            "_create_event_trigger_lambda",
+            "_create_response_generator_lambda",
+            "_create_s3_writer_lambda",
+            "_create_dynamodb_table",
+            "_create_sns_topic",
+        },
+        "_create_failure_alarm": {"_create_step_function", "_create_sns_topic"},
+    }
+    # Resolved once at class definition (a cycle raises graphlib.CycleError on import)
+    _STEP_ORDER = tuple(TopologicalSorter(_STEPS).static_order())
+
     def __init__(self, scope: Construct, construct_id: str, **kwargs) -> None:
         """
         Initialize the CDK stack and sequentially provision all resources.
         """
         super().__init__(scope, construct_id, **kwargs)
 
+        # Every resource is torn down with the stack (dev/thesis environment)
+        Aspects.of(self).add(_ForceDestroy())
+
         # Load configuration and provision resources in dependency order
         self._unpack_env_params()
-        self._create_kinesis_stream()
-        self._create_event_trigger_lambda()
-        self._create_response_generator_lambda()
-        self._create_dynamodb_table()
-        self._create_s3_bucket()
-        self._create_s3_writer_lambda()
-        self._create_sns_topic()
-        self._create_glue_job_and_schedule()
-        self._create_step_function()
-        self._create_failure_alarm()
+        for step in self._STEP_ORDER:
+            getattr(self, step)()
 
     def _unpack_env_params(self) -> None:
         """
@@ -69,198 +201,228 @@ class TicketManagementSystemStack(Stack):
         to instance attributes. Ensures Redshift + networking config is present.
 
         Raises:
-            ValueError: if any required environment variable is missing.
+            ValueError: if any required environment variable is missing, or
+                        a notification email is malformed.
         """
-        load_dotenv()
-        required = [
-            "REDSHIFT_JDBC_CONNECTION_URL",
-            "REDSHIFT_ARN",
-            "REDSHIFT_USERNAME",
-            "REDSHIFT_PASSWORD",
-            "REDSHIFT_DATABASE",
-            "REDSHIFT_SCHEMA",
-            "REDSHIFT_TABLE",
-            "REDSHIFT_SUBNET_ID",
-            "REDSHIFT_SECURITY_GROUP_ID",
-            "AVAILABILITY_ZONE",
-        ]
-        missing = [var for var in required if not os.getenv(var)]
+        env = _env()
+        values = {var: env.get(var) for var in _REQUIRED_ENV_PARAMS}
+        missing = [var for var, value in values.items() if not value]
         if missing:
             raise ValueError(f"Missing required environment variables: {', '.join(missing)}")
 
         # Assign Redshift + networking config
-        self.redshift_jdbc_url = os.getenv("REDSHIFT_JDBC_CONNECTION_URL")
-        self.redshift_arn = os.getenv("REDSHIFT_ARN")
-        self.redshift_username = os.getenv("REDSHIFT_USERNAME")
-        self.redshift_password = os.getenv("REDSHIFT_PASSWORD")
-        self.redshift_database = os.getenv("REDSHIFT_DATABASE")
-        self.redshift_schema = os.getenv("REDSHIFT_SCHEMA")
-        self.redshift_table = os.getenv("REDSHIFT_TABLE")
-        self.redshift_subnet_id = os.getenv("REDSHIFT_SUBNET_ID")
-        self.redshift_security_group_id = os.getenv("REDSHIFT_SECURITY_GROUP_ID")
-        self.availability_zone = os.getenv("AVAILABILITY_ZONE")
-
-        # Parse notification emails and project name
-        emails = os.getenv("NOTIFICATION_EMAILS", "")
-        self.notification_emails = [e.strip() for e in emails.split(",") if e.strip()]
-        self.project_name = os.getenv("PROJECT_NAME")
+        for var, attr in _REQUIRED_ENV_PARAMS.items():
+            setattr(self, attr, values[var])
+
+        # Parse notification emails (de-duplicated, order kept) and project name
+        emails = env.get("NOTIFICATION_EMAILS") or ""
+        self.notification_emails = [s for s in dict.fromkeys(e.strip() for e in emails.split(",")) if s]
+        invalid = [email for email in self.notification_emails if not _EMAIL_RE.match(email)]
+        if invalid:
+            raise ValueError(f"Invalid NOTIFICATION_EMAILS entries: {', '.join(invalid)}")
+        self.project_name = env.get("PROJECT_NAME")
+
+        # Optional Kinesis throughput settings (no shard count = on-demand stream)
+        shard_count = env.get("KDS_SHARDS")
+        self.kinesis_shard_count = int(shard_count) if shard_count else None
+        self.kinesis_parallelization = int(env.get("KDS_PARALLEL") or 10)
+
+        # Bedrock model (or cross-region inference profile) the responses are generated with
+        self.bedrock_model_id = env.get("BEDROCK_MODEL_ID") or "us.amazon.nova-pro-v1:0"
 
     def _create_kinesis_stream(self) -> None:
         """
         Create a Kinesis Data Stream for ingesting raw ticket events.
         """
+        pn = self.project_name
+
         self.ticket_stream = kinesis.Stream(
             self,
-            f"{self.project_name}KinesisStream",
-            stream_name=f"{self.project_name}-kinesis-stream",
-            shard_count=1,  # single shard is enough for demo
+            f"{pn}KinesisStream",
+            stream_name=f"{pn}-kinesis-stream",
+            # On-demand capacity scales shards with traffic, unless a fixed
+            # shard count is configured
+            stream_mode=kinesis.StreamMode.PROVISIONED if self.kinesis_shard_count else kinesis.StreamMode.ON_DEMAND,
+            shard_count=self.kinesis_shard_count,
             retention_period=Duration.hours(24),
         )
-        self.ticket_stream.apply_removal_policy(RemovalPolicy.DESTROY)
+
+    def _create_lambda_role(self) -> None:
+        """
+        Execution role shared by the three Lambda functions (basic execution +
+        bedrock:InvokeModel on the configured model; Kinesis, S3 and Step Functions
+        access is added by the steps that create those resources).
+        """
+        pn = self.project_name
+        model_id = self.bedrock_model_id
+
+        # A cross-region inference profile ("us.amazon.nova-pro-v1:0") needs the
+        # profile itself plus the foundation model in every region it routes to
+        geo, _, base_model_id = model_id.partition(".")
+        if geo in ("us", "eu", "apac") and base_model_id:
+            bedrock_resources = [
+                f"arn:aws:bedrock:{self.region}:{self.account}:inference-profile/{model_id}",
+                f"arn:aws:bedrock:*::foundation-model/{base_model_id}",
+            ]
+        else:
+            bedrock_resources = [f"arn:aws:bedrock:{self.region}::foundation-model/{model_id}"]
+
+        self.lambda_role = iam.Role(
+            self,
+            f"{pn}LambdaRole",
+            assumed_by=iam.ServicePrincipal("lambda.amazonaws.com"),
+            role_name=f"{pn}-lambda-role",
+            managed_policies=[_managed("service-role/AWSLambdaBasicExecutionRole")],
+            inline_policies={
+                "default": iam.PolicyDocument(
+                    statements=[iam.PolicyStatement(actions=["bedrock:InvokeModel"], resources=bedrock_resources)]
+                )
+            },
+        )
 
     def _create_event_trigger_lambda(self) -> None:
         """
         Lambda that consumes Kinesis events and triggers the Step Functions workflow.
         Filters only events with `eventName: TicketSubmitted`.
         """
-        # IAM role with Kinesis read + StepFunctions start permissions
-        self.event_trigger_role = iam.Role(
+        pn = self.project_name
+
+        # Enhanced fan-out consumer: records are pushed to the Lambda over HTTP/2
+        # with dedicated read throughput, instead of polled once per second
+        self.ticket_stream_consumer = kinesis.CfnStreamConsumer(
             self,
-            f"{self.project_name}SfnTriggerRole",
-            assumed_by=iam.ServicePrincipal("lambda.amazonaws.com"),
-            role_name=f"{self.project_name}-sfn-trigger-role"
+            f"{pn}TicketStreamConsumer",
+            consumer_name=f"{pn}-ticket-efo",
+            stream_arn=self.ticket_stream.stream_arn,
         )
-        self.event_trigger_role.add_managed_policy(
-            iam.ManagedPolicy.from_aws_managed_policy_name(
-                "service-role/AWSLambdaBasicExecutionRole"
-            )
-        )
-        self.event_trigger_role.add_to_policy(
+
+        # Kinesis read on the shared Lambda role: the stream permissions Lambda
+        # documents for Kinesis event sources (managed policy), plus the EFO
+        # consumer it subscribes through
+        self.lambda_role.add_managed_policy(_managed("service-role/AWSLambdaKinesisExecutionRole"))
+        self.lambda_role.add_to_policy(
             iam.PolicyStatement(
-                actions=[
-                    "kinesis:GetRecords",
-                    "kinesis:GetShardIterator",
-                    "kinesis:DescribeStream",
-                    "kinesis:ListShards",
-                    "kinesis:SubscribeToShard",
-                ],
-                resources=[self.ticket_stream.stream_arn],
+                actions=["kinesis:SubscribeToShard", "kinesis:DescribeStreamConsumer"],
+                resources=[self.ticket_stream_consumer.attr_consumer_arn],
             )
         )
-        self.event_trigger_role.apply_removal_policy(RemovalPolicy.DESTROY)
 
         # Lambda definition
         self.event_trigger_lambda = _lambda.Function(
             self,
-            f"{self.project_name}SfnTrigger",
-            function_name=f"{self.project_name}-sfn-trigger",
-            runtime=_lambda.Runtime.PYTHON_3_11,
+            f"{pn}SfnTrigger",
+            function_name=f"{pn}-sfn-trigger",
+            runtime=self._PY312,
+            architecture=self._ARM,
             handler="handler.lambda_handler",
-            code=_lambda.Code.from_asset("ticket_management_system/lambdas/TriggerSFN"),
-            timeout=Duration.seconds(30),
-            role=self.event_trigger_role,
+            code=_lambda_code("ticket_management_system/lambdas/TriggerSFN"),
+            memory_size=512,
+            timeout=self._T30S,
+            role=self.lambda_role,
+        )
+
+        # Records still failing once the retries below run out are not dropped:
+        # their batch details (shard and sequence number range) land here
+        self.ticket_stream_failures = sqs.Queue(
+            self,
+            f"{pn}TicketStreamFailures",
+            queue_name=f"{pn}-ticket-stream-failures",
+            retention_period=Duration.days(14),
         )
-        self.event_trigger_lambda.apply_removal_policy(RemovalPolicy.DESTROY)
+        self.ticket_stream_failures.grant_send_messages(self.lambda_role)
 
         # Event source mapping with JSON filter
-        CfnEventSourceMapping(
+        self.event_source_mapping = CfnEventSourceMapping(
             self,
             "FilteredKinesisMapping",
             function_name=self.event_trigger_lambda.function_name,
-            event_source_arn=self.ticket_stream.stream_arn,
+            event_source_arn=self.ticket_stream_consumer.attr_consumer_arn,
             starting_position="LATEST",
             batch_size=100,
-            filter_criteria={"Filters": [{"Pattern": '{ "eventName": ["TicketSubmitted"] }'}]},
-        ).apply_removal_policy(RemovalPolicy.DESTROY)
+            # Wait up to 1s to fill a batch, and process each shard with
+            # several concurrent invocations (ordering kept per partition key)
+            maximum_batching_window_in_seconds=1,
+            parallelization_factor=self.kinesis_parallelization,
+            # Retry only the records the handler reports as failed, split
+            # failing batches to isolate bad records, and bound the retries
+            function_response_types=["ReportBatchItemFailures"],
+            bisect_batch_on_function_error=True,
+            maximum_retry_attempts=5,
+            maximum_record_age_in_seconds=3600,
+            destination_config=CfnEventSourceMapping.DestinationConfigProperty(
+                on_failure=CfnEventSourceMapping.OnFailureProperty(
+                    destination=self.ticket_stream_failures.queue_arn
+                )
+            ),
+            filter_criteria=CfnEventSourceMapping.FilterCriteriaProperty(
+                filters=[CfnEventSourceMapping.FilterProperty(pattern=_TICKET_FILTER_PATTERN)]
+            ),
+        )
 
     def _create_response_generator_lambda(self) -> None:
         """
         Lambda that calls AWS Bedrock (LLM) to generate automated responses.
         """
-        # Dependency layer
-        self.response_generator_layer = _lambda.LayerVersion(
-            self,
-            f"{self.project_name}ResponseGeneratorLayer",
-            layer_version_name=f"{self.project_name}-response-generator-layer",
-            code=_lambda.Code.from_asset(
-                "ticket_management_system/lambda_layers/ResponseGenerator/lambda-layer.zip"
-            ),
-            compatible_runtimes=[_lambda.Runtime.PYTHON_3_11],
-        )
-        self.response_generator_layer.apply_removal_policy(RemovalPolicy.DESTROY)
-
-        # IAM role with logging + bedrock:InvokeModel
-        self.response_generator_role = iam.Role(
-            self,
-            f"{self.project_name}ResponseGeneratorRole",
-            assumed_by=iam.ServicePrincipal("lambda.amazonaws.com"),
-            role_name=f"{self.project_name}ResponseGeneratorRole"
-        )
-        self.response_generator_role.add_to_policy(
-            iam.PolicyStatement(
-                actions=["logs:CreateLogGroup", "logs:CreateLogStream", "logs:PutLogEvents"],
-                resources=[f"arn:aws:logs:{self.region}:{self.account}:*"],
-            )
-        )
-        self.response_generator_role.add_to_policy(
-            iam.PolicyStatement(actions=["bedrock:InvokeModel"], resources=["*"])
-        )
-        self.response_generator_role.apply_removal_policy(RemovalPolicy.DESTROY)
+        pn = self.project_name
 
         # Lambda definition
-        self.response_generator_lambda = _lambda.Function(
+        self.response_generator_lambda = _lambda.DockerImageFunction(
             self,
-            f"{self.project_name}ResponseGenerator",
-            function_name=f"{self.project_name}-response-generator",
-            runtime=_lambda.Runtime.PYTHON_3_11,
-            handler="handler.lambda_handler",
-            code=_lambda.Code.from_asset("ticket_management_system/lambdas/ResponseGenerator"),
-            timeout=Duration.seconds(60),
-            role=self.response_generator_role,
-            layers=[self.response_generator_layer],
+            f"{pn}ResponseGenerator",
+            function_name=f"{pn}-response-generator",
+            # Image with the handler and its pinned requirements (see Dockerfile)
+            code=_lambda.DockerImageCode.from_image_asset(
+                "ticket_management_system/lambdas/ResponseGenerator",
+                platform=ecr_assets.Platform.LINUX_ARM64,
+                exclude=_ASSET_EXCLUDE,
+            ),
+            # Built for Graviton like the other functions (the base image is
+            # multi-arch, so pip resolves aarch64 wheels inside the build);
+            # CPU scales with memory, which speeds up prompt and JSON handling
+            architecture=self._ARM,
+            memory_size=1024,
+            timeout=self._T60S,
+            role=self.lambda_role,
+            environment={"BEDROCK_MODEL_ID": self.bedrock_model_id},
         )
-        self.response_generator_lambda.apply_removal_policy(RemovalPolicy.DESTROY)
 
     def _create_s3_writer_lambda(self) -> None:
         """
         Lambda that writes processed tickets (LLM + metadata) into S3.
         """
-        # IAM role with basic execution + bucket write access
-        self.s3_writer_role = iam.Role(
-            self,
-            f"{self.project_name}S3WriterRole",
-            assumed_by=iam.ServicePrincipal("lambda.amazonaws.com"),
-            role_name=f"{self.project_name}-s3-writer-role"
-        )
-        self.s3_writer_role.add_managed_policy(
-            iam.ManagedPolicy.from_aws_managed_policy_name("service-role/AWSLambdaBasicExecutionRole")
-        )
-        self.tickets_bucket.grant_write(self.s3_writer_role)
-        self.s3_writer_role.apply_removal_policy(RemovalPolicy.DESTROY)
+        pn = self.project_name
 
         # Lambda definition
         self.s3_writer_lambda = _lambda.Function(
             self,
-            f"{self.project_name}S3Writer",
-            function_name=f"{self.project_name}-s3-writer",
-            runtime=_lambda.Runtime.PYTHON_3_11,
+            f"{pn}S3Writer",
+            function_name=f"{pn}-s3-writer",
+            runtime=self._PY312,
+            architecture=self._ARM,
             handler="handler.lambda_handler",
-            code=_lambda.Code.from_asset("ticket_management_system/lambdas/S3Writer"),
-            timeout=Duration.seconds(30),
-            role=self.s3_writer_role,
+            code=_lambda_code("ticket_management_system/lambdas/S3Writer"),
+            memory_size=512,
+            timeout=self._T30S,
+            role=self.lambda_role,
             environment={"S3_BUCKET_NAME": self.tickets_bucket.bucket_name},
         )
-        self.s3_writer_lambda.apply_removal_policy(RemovalPolicy.DESTROY)
 
     def _create_dynamodb_table(self) -> None:
         """
         DynamoDB table to store ticket metadata (ID, timestamps, status).
         """
+        pn = self.project_name
+
         self.tickets_table = dynamodb.Table(
             self,
-            f"{self.project_name}DdbTable",
-            table_name=f"{self.project_name}-ddb-table",
+            f"{pn}DdbTable",
+            table_name=f"{pn}-ddb-table",
             partition_key=dynamodb.Attribute(name="ticket_id", type=dynamodb.AttributeType.STRING),
+            # On-demand: bursty ticket writes, nothing paid while idle
+            billing_mode=dynamodb.BillingMode.PAY_PER_REQUEST,
+            point_in_time_recovery_specification=dynamodb.PointInTimeRecoverySpecification(
+                point_in_time_recovery_enabled=False
+            ),
             removal_policy=RemovalPolicy.DESTROY,
         )
 
@@ -268,49 +430,52 @@ class TicketManagementSystemStack(Stack):
         """
         S3 bucket to store full processed ticket JSONs.
         """
+        pn = self.project_name
+
         self.tickets_bucket = s3.Bucket(
             self,
-            f"{self.project_name}Bucket",
-            bucket_name=f"{self.project_name}-bucket".lower(),
+            f"{pn}Bucket",
+            bucket_name=f"{pn}-bucket".lower(),
             removal_policy=RemovalPolicy.DESTROY,
             auto_delete_objects=True,
         )
-        self.tickets_bucket.grant_write(self.response_generator_role)
+        self.tickets_bucket.grant_write(self.lambda_role)
 
     def _create_sns_topic(self) -> None:
         """
         SNS topic for notifications and alerts (subscribed emails).
         """
+        pn = self.project_name
+
         self.notification_topic = sns.Topic(
             self,
-            f"{self.project_name}NotificationsTopic",
-            topic_name=f"{self.project_name}NotificationsTopic",
-            display_name=f"{self.project_name}NotificationsTopic",
+            f"{pn}NotificationsTopic",
+            topic_name=f"{pn}NotificationsTopic",
+            display_name=f"{pn}NotificationsTopic",
         )
-        self.notification_topic.apply_removal_policy(RemovalPolicy.DESTROY)
 
-        # Subscribe configured emails
+        # Subscribe configured emails (already de-duplicated in _unpack_env_params)
+        add_subscription = self.notification_topic.add_subscription
         for email in self.notification_emails:
-            self.notification_topic.add_subscription(subs.EmailSubscription(email))
+            add_subscription(subs.EmailSubscription(email))
 
     def _create_glue_job_and_schedule(self) -> None:
         """
         AWS Glue ETL job to load ticket JSONs from S3 into Redshift.
-        Scheduled via EventBridge every 2 hours.
+        Scheduled by a Glue trigger every 2 hours.
         """
+        pn, account = self.project_name, self.account
+        conn_name = f"{pn}-redshift-connection"
+
         # Redshift JDBC connection
         self.redshift_connection = glue.CfnConnection(
             self,
-            f"{self.project_name}RedshiftConnection",
-            catalog_id=self.account,
+            f"{pn}RedshiftConnection",
+            catalog_id=account,
             connection_input=glue.CfnConnection.ConnectionInputProperty(
-                name=f"{self.project_name}-redshift-connection",
+                name=conn_name,
                 connection_type="JDBC",
-                connection_properties={
-                    "JDBC_CONNECTION_URL": self.redshift_jdbc_url,
-                    "USERNAME": self.redshift_username,
-                    "PASSWORD": self.redshift_password,
-                },
+                connection_properties={key: getattr(self, attr) for key, attr in _REDSHIFT_CONN_PROPERTIES},
                 physical_connection_requirements=glue.CfnConnection.PhysicalConnectionRequirementsProperty(
                     subnet_id=self.redshift_subnet_id,
                     security_group_id_list=[self.redshift_security_group_id],
@@ -319,46 +484,86 @@ class TicketManagementSystemStack(Stack):
             ),
         )
 
-        # IAM role for Glue job (S3 + Redshift access)
+        # Job script, uploaded as a content-hashed CDK asset (only when it changes)
+        script_asset = s3_assets.Asset(
+            self,
+            "GlueScriptAsset",
+            path="ticket_management_system/glue_scripts/ticket_processing_job.py",
+        )
+
+        # IAM role for Glue job, with all of its statements in one inline document:
+        # the script, S3 access scoped to the prefixes the job touches (it reads
+        # tickets/ and stages the Redshift COPY files under temp/), and Redshift
+        bucket_arn = self.tickets_bucket.bucket_arn
         self.glue_job_role = iam.Role(
             self,
-            f"{self.project_name}GlueJobRole",
+            f"{pn}GlueJobRole",
             assumed_by=iam.ServicePrincipal("glue.amazonaws.com"),
-            role_name=f"{self.project_name}-glue-job-role"
-        )
-        self.glue_job_role.add_managed_policy(
-            iam.ManagedPolicy.from_aws_managed_policy_name("service-role/AWSGlueServiceRole")
-        )
-        self.tickets_bucket.grant_read(self.glue_job_role)
-        self.glue_job_role.add_to_policy(
-            iam.PolicyStatement(
-                actions=["redshift:GetClusterCredentials", "redshift:CreateClusterUser", "redshift:DescribeClusters"],
-                resources=[self.redshift_arn],
-            )
+            role_name=f"{pn}-glue-job-role",
+            managed_policies=[_managed("service-role/AWSGlueServiceRole")],
+            inline_policies={
+                "RolePolicy": iam.PolicyDocument(
+                    statements=[
+                        iam.PolicyStatement(
+                            actions=["s3:GetObject"],
+                            resources=[script_asset.bucket.arn_for_objects(script_asset.s3_object_key)],
+                        ),
+                        iam.PolicyStatement(
+                            actions=["s3:ListBucket"],
+                            resources=[bucket_arn],
+                            conditions={
+                                "StringLike": {
+                                    "s3:prefix": ["tickets", "tickets/*", "temp", "temp/*"]
+                                }
+                            },
+                        ),
+                        iam.PolicyStatement(
+                            actions=["s3:GetObject"],
+                            resources=[f"{bucket_arn}/tickets/*", f"{bucket_arn}/temp/*"],
+                        ),
+                        iam.PolicyStatement(
+                            actions=["s3:PutObject", "s3:DeleteObject"],
+                            resources=[f"{bucket_arn}/temp/*"],
+                        ),
+                        iam.PolicyStatement(
+                            actions=[
+                                "redshift:GetClusterCredentials",
+                                "redshift:CreateClusterUser",
+                                "redshift:DescribeClusters",
+                            ],
+                            resources=[self.redshift_arn],
+                        ),
+                    ]
+                )
+            },
         )
-        self.glue_job_role.apply_removal_policy(RemovalPolicy.DESTROY)
+
+        # Bucket name is referenced several times below
+        bucket_name = self.tickets_bucket.bucket_name
+        temp_dir = f"s3://{bucket_name}/temp/"
 
         # Glue job definition
         self.glue_job = glue.CfnJob(
             self,
-            f"{self.project_name}Job",
-            name=f"{self.project_name}-job",
+            f"{pn}Job",
+            name=f"{pn}-job",
             role=self.glue_job_role.role_arn,
             command=glue.CfnJob.JobCommandProperty(
                 name="glueetl",
                 python_version="3",
-                script_location=f"s3://{self.tickets_bucket.bucket_name}/scripts/ticket_processing_job.py",
+                script_location=script_asset.s3_object_url,
             ),
             connections=glue.CfnJob.ConnectionsListProperty(
-                connections=[self.redshift_connection.connection_input.name]
+                connections=[conn_name]
             ),
             default_arguments={
-                "--S3_BUCKET": self.tickets_bucket.bucket_name,
+                "--S3_BUCKET": bucket_name,
                 "--REDSHIFT_DATABASE": self.redshift_database,
                 "--REDSHIFT_SCHEMA": self.redshift_schema,
                 "--REDSHIFT_TABLE": self.redshift_table,
-                "--REDSHIFT_CONNECTION": self.redshift_connection.connection_input.name,
-                "--TEMP_DIR": f"s3://{self.tickets_bucket.bucket_name}/temp/",
+                "--REDSHIFT_CONNECTION": conn_name,
+                "--REDSHIFT_IAM_ROLE": self.redshift_iam_role_arn,
+                "--TEMP_DIR": temp_dir,
                 "--job-bookmark-option": "job-bookmark-enable",
                 "--enable-metrics": "",
                 "--enable-continuous-cloudwatch-log": "true",
@@ -367,38 +572,25 @@ class TicketManagementSystemStack(Stack):
             glue_version="4.0",
             number_of_workers=2,
             worker_type="G.1X",
+            # Non-urgent batch load: spare-capacity Flex pricing, and never two
+            # overlapping runs of the schedule
+            execution_class="FLEX",
+            execution_property=glue.CfnJob.ExecutionPropertyProperty(max_concurrent_runs=1),
         )
-        self.glue_job.apply_removal_policy(RemovalPolicy.DESTROY)
 
-        # EventBridge rule to run job every 2h
-        self.glue_schedule_rule = events.Rule(
+        # Native Glue scheduled trigger, runs the job every 2h
+        self.glue_schedule_trigger = glue.CfnTrigger(
             self,
-            f"{self.project_name}JobSchedule",
-            rule_name=f"{self.project_name}-job-schedule",
-            schedule=events.Schedule.rate(Duration.hours(2)),
+            f"{pn}JobSchedule",
+            name=f"{pn}-job-schedule",
+            type="SCHEDULED",
+            schedule="cron(0 */2 * * ? *)",
+            start_on_creation=True,
             description="Trigger Glue job every 2 hours",
+            actions=[glue.CfnTrigger.ActionProperty(job_name=self.glue_job.name)],
         )
-        self.glue_schedule_rule.add_target(
-            targets.AwsApi(
-                service="glue",
-                action="startJobRun",
-                parameters={"JobName": self.glue_job.name},
-                policy_statement=iam.PolicyStatement(
-                    actions=["glue:StartJobRun"],
-                    resources=[f"arn:aws:glue:{self.region}:{self.account}:job/{self.glue_job.name}"],
-                ),
-            )
-        )
-        self.glue_schedule_rule.apply_removal_policy(RemovalPolicy.DESTROY)
-
-        # Deploy local Glue scripts to S3
-        s3deploy.BucketDeployment(
-            self,
-            "GlueScriptDeployment",
-            sources=[s3deploy.Source.asset("ticket_management_system/glue_scripts")],
-            destination_bucket=self.tickets_bucket,
-            destination_key_prefix="scripts/",
-        )
+        # The job is referenced by its literal name, so order it explicitly
+        self.glue_schedule_trigger.add_dependency(self.glue_job)
 
     def _create_step_function(self) -> None:
         """
@@ -408,63 +600,129 @@ class TicketManagementSystemStack(Stack):
           3. Write metadata (DynamoDB + SNS)
           4. Write full object (S3 Writer Lambda)
         """
+        pn = self.project_name
+
+        # Express executions have no execution history, so errors are logged here
+        self.state_machine_log_group = logs.LogGroup(
+            self,
+            f"{pn}SfnLogGroup",
+            log_group_name=f"/aws/vendedlogs/states/{pn}-sfn",
+            retention=logs.RetentionDays.ONE_WEEK,
+        )
+
+        # Role with every permission the workflow needs in one inline document
         self.state_machine_role = iam.Role(
             self,
-            f"{self.project_name}SfnRole",
+            f"{pn}SfnRole",
             assumed_by=iam.ServicePrincipal("states.amazonaws.com"),
-            role_name=f"{self.project_name}-sfn-role"
+            role_name=f"{pn}-sfn-role",
+            inline_policies={
+                "RolePolicy": iam.PolicyDocument(
+                    statements=[
+                        iam.PolicyStatement(actions=["comprehend:DetectSentiment"], resources=["*"]),
+                        iam.PolicyStatement(
+                            actions=["lambda:InvokeFunction"],
+                            resources=[self.response_generator_lambda.function_arn, self.s3_writer_lambda.function_arn],
+                        ),
+                        iam.PolicyStatement(actions=["dynamodb:PutItem"], resources=[self.tickets_table.table_arn]),
+                        iam.PolicyStatement(actions=["sns:Publish"], resources=[self.notification_topic.topic_arn]),
+                        # CloudWatch Logs delivery for the execution logs (these
+                        # actions don't support resource-level permissions)
+                        iam.PolicyStatement(
+                            actions=[
+                                "logs:CreateLogDelivery",
+                                "logs:GetLogDelivery",
+                                "logs:UpdateLogDelivery",
+                                "logs:DeleteLogDelivery",
+                                "logs:ListLogDeliveries",
+                                "logs:PutResourcePolicy",
+                                "logs:DescribeResourcePolicies",
+                                "logs:DescribeLogGroups",
+                            ],
+                            resources=["*"],
+                        ),
+                    ]
+                )
+            },
         )
-        self.state_machine_role.apply_removal_policy(RemovalPolicy.DESTROY)
-
-        # Grant required permissions
-        self.state_machine_role.add_to_policy(iam.PolicyStatement(actions=["comprehend:DetectSentiment"], resources=["*"]))
-        self.state_machine_role.add_to_policy(iam.PolicyStatement(actions=["lambda:InvokeFunction"], resources=[
-            self.response_generator_lambda.function_arn, self.s3_writer_lambda.function_arn
-        ]))
-        self.tickets_table.grant_write_data(self.state_machine_role)
-        self.notification_topic.grant_publish(self.state_machine_role)
-
-        # Load ASL definition and substitute ARNs
-        state_machine_definition = pathlib.Path(__file__).parent.joinpath("state_machine", "state_machine.json").read_text()
+
+        # Load ASL definition and substitute ARNs at synth time (compact JSON)
         substitutions = {
             "ResponseGeneratorArn": self.response_generator_lambda.function_arn,
             "S3WriterArn": self.s3_writer_lambda.function_arn,
             "TicketsTableName": self.tickets_table.table_name,
             "NotificationTopicArn": self.notification_topic.topic_arn,
         }
+        state_machine_definition = json.dumps(
+            _substitute(_asl_definition(), substitutions), separators=(",", ":")
+        )
 
         self.state_machine = sfn.CfnStateMachine(
             self,
-            f"{self.project_name}Sfn",
+            f"{pn}Sfn",
             role_arn=self.state_machine_role.role_arn,
-            state_machine_name=f"{self.project_name}-sfn",
-            state_machine_type="STANDARD",
+            state_machine_name=f"{pn}-sfn",
+            # Short, high-volume workflow: billed per duration instead of per transition
+            state_machine_type="EXPRESS",
             definition_string=state_machine_definition,
-            definition_substitutions=substitutions,
+            logging_configuration=sfn.CfnStateMachine.LoggingConfigurationProperty(
+                level="ERROR",
+                include_execution_data=False,
+                destinations=[
+                    sfn.CfnStateMachine.LogDestinationProperty(
+                        cloud_watch_logs_log_group=sfn.CfnStateMachine.CloudWatchLogsLogGroupProperty(
+                            log_group_arn=self.state_machine_log_group.log_group_arn
+                        )
+                    )
+                ],
+            ),
         )
-        self.state_machine.apply_removal_policy(RemovalPolicy.DESTROY)
 
         # Pass ARN into trigger Lambda env
         self.event_trigger_lambda.add_environment("SFN_ARN", self.state_machine.attr_arn)
-        self.event_trigger_role.add_to_policy(
-            iam.PolicyStatement(actions=["states:StartExecution"], resources=[self.state_machine.attr_arn])
+        # Separate policy: the role's default policy is a dependency of every
+        # function, including the ones the state machine references (cycle)
+        start_execution_policy = iam.Policy(
+            self,
+            f"{pn}SfnStartExecutionPolicy",
+            statements=[
+                iam.PolicyStatement(actions=["states:StartExecution"], resources=[self.state_machine.attr_arn])
+            ],
+            roles=[self.lambda_role],
         )
+        self.event_source_mapping.node.add_dependency(start_execution_policy)
 
     def _create_failure_alarm(self) -> None:
         """
-        CloudWatch alarm → triggers SNS notification if Step Functions execution fails.
+        CloudWatch alarm → triggers SNS notification if a Step Functions execution
+        fails, times out or is aborted.
         """
-        failure_metric = cloudwatch.Metric(
-            namespace="AWS/States",
-            metric_name="ExecutionsFailed",
-            dimensions_map={"StateMachineArn": self.state_machine.attr_arn},
-            statistic="Sum",
+        pn = self.project_name
+
+        # Every terminal failure mode, summed in one metric-math expression
+        # (FILL keeps the sum defined when only some of the metrics have data)
+        failure_metrics = {
+            f"m{index}": cloudwatch.Metric(
+                namespace="AWS/States",
+                metric_name=metric_name,
+                dimensions_map={"StateMachineArn": self.state_machine.attr_arn},
+                statistic="Sum",
+                period=Duration.minutes(1),
+            )
+            for index, metric_name in enumerate(
+                ("ExecutionsFailed", "ExecutionsTimedOut", "ExecutionsAborted"), start=1
+            )
+        }
+        failure_metric = cloudwatch.MathExpression(
+            expression=" + ".join(f"FILL({name}, 0)" for name in failure_metrics),
+            using_metrics=failure_metrics,
+            label="Failed, timed out or aborted executions",
             period=Duration.minutes(1),
         )
         self.failure_alarm = cloudwatch.Alarm(
             self,
-            f"{self.project_name}SfnFailureAlarm",
-            alarm_name=f"{self.project_name}-sfn-failure-alarm",
+            f"{pn}SfnFailureAlarm",
+            alarm_name=f"{pn}-sfn-failure-alarm",
             metric=failure_metric,
             evaluation_periods=1,
             threshold=0,
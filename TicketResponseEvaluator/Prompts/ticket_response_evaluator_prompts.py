@@ -113,19 +113,12 @@ OUTPUT:
 }
 """
 
-TICKET_RESPONSE_EVALUATOR_TEMPLATE = """
+# Constant sections, identical for every ticket: formatted once and sent as a
+# cached system block
+TICKET_RESPONSE_EVALUATOR_STATIC_CONTEXT = """
 ### Task:
 {task}
 
-### Ticket Subject:
-{ticket_subject}
-
-### Ticket Description:
-{ticket_description}
-
-### Response Provided:
-{response_text}
-
 ### Guidelines:
 {guidelines}
 
@@ -136,7 +129,16 @@ TICKET_RESPONSE_EVALUATOR_TEMPLATE = """
 - Default to FALSE if a criterion is even slightly questionable.
 - Only mark TRUE when all conditions for that criterion are explicitly met.
 - No partial credit.
+"""
+
+# Per-ticket sections, formatted for every evaluation
+TICKET_RESPONSE_EVALUATOR_TEMPLATE = """
+### Ticket Subject:
+{ticket_subject}
 
-**Output Format**:
-{format_instructions}
+### Ticket Description:
+{ticket_description}
+
+### Response Provided:
+{response_text}
 """
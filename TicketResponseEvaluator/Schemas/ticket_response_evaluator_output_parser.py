@@ -1,5 +1,5 @@
 from typing import Dict
-from langchain_core.output_parsers import JsonOutputParser
+from langchain_core.utils.function_calling import convert_to_openai_function
 from pydantic import BaseModel, Field
 
 # ---- Evaluation Schema ----
@@ -17,8 +17,12 @@ class TicketResponseEvaluation(BaseModel):
         description="True if the response contains two to three specific, immediately executable troubleshooting steps that the customer can perform without ambiguity."
     )
 class TicketResponseEvaluationOutput(BaseModel):
+    """Submit the evaluation of the support response."""
+
     output: TicketResponseEvaluation
 
-ticket_response_evaluation_parser = JsonOutputParser(
-    pydantic_object=TicketResponseEvaluationOutput
-)
+
+# Tool the model is forced to call with the evaluation: the arguments follow the
+# schema and come back from the Converse API already parsed (plain dicts, no
+# JSON extraction or Pydantic validation per ticket)
+ticket_response_evaluation_tool = convert_to_openai_function(TicketResponseEvaluationOutput)
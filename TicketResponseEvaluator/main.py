@@ -1,67 +1,246 @@
-import pickle
+import argparse
+import asyncio
+import hashlib
 import json
-from langchain_aws import ChatBedrock
-from langchain_core.prompts import ChatPromptTemplate, PromptTemplate
+import logging
+import os
+import pathlib
+from concurrent.futures import ThreadPoolExecutor
+import orjson
+from botocore.config import Config
+from botocore.exceptions import ClientError
+from langchain_aws import ChatBedrockConverse
+from langchain_core.messages import HumanMessage, SystemMessage
+from langchain_core.runnables import RunnableLambda
 
 from Prompts.ticket_response_evaluator_prompts import *
-from Schemas.ticket_response_evaluator_output_parser import ticket_response_evaluation_parser
-
-
-file_path = "ProcessedTickets/processed_tickets000.json"
-
-# List to hold all tickets loaded from the file
-tickets = []
-with open(file_path, "r", encoding="utf-8") as f:
-    for line in f:
-        line = line.strip()
-        if line:  # Ignore empty lines
-            tickets.append(json.loads(line))  # Parse each line as JSON
-
-# Initialize the Bedrock model with given parameters
-llm = ChatBedrock(model_id="us.amazon.nova-pro-v1:0", temperature=0.2, max_tokens=200)
-
-# Store evaluation results for each ticket
-evals = []
-
-# Process each ticket one by one
-for ticket in tickets:
-    ticket_subject = ticket["subject"]
-    ticket_description = ticket["description"]
-    response_text = ticket["response_text"]
-    
-    # Build the evaluator prompt by filling the template with ticket data
-    prompt_text = PromptTemplate.from_template(TICKET_RESPONSE_EVALUATOR_TEMPLATE).format(
-        task=TICKET_RESPONSE_EVALUATOR_TASK,
-        ticket_subject=ticket_subject,
-        ticket_description=ticket_description,
-        response_text=response_text,
-        guidelines=TICKET_RESPONSE_EVALUATOR_GUIDELINES,
-        examples=TICKET_RESPONSE_EVALUATOR_EXAMPLES,
-        format_instructions=ticket_response_evaluation_parser.get_format_instructions(),
-    )
+from Schemas.ticket_response_evaluator_output_parser import ticket_response_evaluation_tool
 
-    # Define the conversation structure for the LLM
-    prompt_messages = [
-        ("system", TICKET_RESPONSE_EVALUATOR_SYSTEM_ROLE),
-        (
-            "human",
-            [{"type": "text", "text": "{prompt_text}"}],  # Placeholder for actual prompt text
-        ),
+logging.basicConfig(level=os.getenv("LOG_LEVEL", "INFO"))
+log = logging.getLogger(__name__)
+# langchain_aws logs every Converse call at INFO
+logging.getLogger("langchain_aws").setLevel(logging.WARNING)
+
+# Defaults for the command-line arguments
+INPUT_PATH = "ProcessedTickets/processed_tickets000.json"
+OUTPUT_PATH = "Evals/ticket_evaluations.jsonl"
+MODEL_ID = "us.amazon.nova-pro-v1:0"
+
+# Evaluations in flight at once (Bedrock calls are I/O-bound), and tickets read
+# ahead of them
+MAX_CONCURRENCY = 16
+QUEUE_SIZE = 64
+
+# On-disk cache of evaluations (one JSON file per prompt), so re-runs only call
+# Bedrock for tickets whose prompt or model settings changed
+CACHE_DIR = pathlib.Path(".llm_cache")
+
+# Role + constant task/guidelines/examples/strict rules, followed by a cache
+# point: Bedrock caches this prefix instead of re-processing it for every ticket
+system_message = SystemMessage(
+    content=[
+        {"text": TICKET_RESPONSE_EVALUATOR_SYSTEM_ROLE},
+        {
+            "text": TICKET_RESPONSE_EVALUATOR_STATIC_CONTEXT.format(
+                task=TICKET_RESPONSE_EVALUATOR_TASK,
+                guidelines=TICKET_RESPONSE_EVALUATOR_GUIDELINES,
+                examples=TICKET_RESPONSE_EVALUATOR_EXAMPLES,
+            )
+        },
+        ChatBedrockConverse.create_cache_point(),
     ]
+)
+
+
+def build_prompt(inputs):
+    # Conversation structure for the LLM: the fixed system message plus the
+    # per-ticket template, filled with one str.format_map (the ticket fields are
+    # substituted as values, never parsed as template text)
+    return [system_message, HumanMessage(content=TICKET_RESPONSE_EVALUATOR_TEMPLATE.format_map(inputs))]
+
+
+def build_llm(model_id, concurrency):
+    # Initialize the Bedrock model with given parameters
+    # (Converse API, so the system prompt can carry a cache point; one pooled
+    # connection per concurrent evaluation, throttled calls retried with adaptive
+    # client-side rate limiting). The answer is a single tool call with four
+    # booleans, so output is capped a few times above its size (a call cut off by
+    # the cap comes back without the tool call), and temperature 0 keeps the
+    # grading deterministic for the response cache
+    return ChatBedrockConverse(
+        model=model_id,
+        temperature=0,
+        max_tokens=300,
+        config=Config(
+            max_pool_connections=concurrency,
+            retries={"mode": "adaptive", "max_attempts": 8},
+        ),
+    )
+
+
+def is_evaluation(llm_response):
+    # Tool arguments in the shape of TicketResponseEvaluationOutput
+    return isinstance(llm_response, dict) and isinstance(llm_response.get("output"), dict)
+
+
+def check_evaluation(llm_response):
+    # The tools parser returns None when the model answered without calling the
+    # evaluation tool: fail the call instead of caching or writing that
+    if not is_evaluation(llm_response):
+        raise ValueError(f"Model response is not an evaluation: {llm_response!r}")
+    return llm_response
+
+
+def build_chain(llm):
+    # Create a chain: prompt → LLM forced to call the evaluation tool, whose
+    # arguments (already shaped by the tool schema) are the result
+    # A Bedrock call still failing once botocore gives up (sustained throttling),
+    # or answered without the tool call, is retried a few more times with
+    # jittered backoff instead of aborting the run
+    model = llm.with_structured_output(ticket_response_evaluation_tool) | RunnableLambda(check_evaluation)
+    return RunnableLambda(build_prompt) | model.with_retry(
+        retry_if_exception_type=(ClientError, ValueError),
+        stop_after_attempt=3,
+        wait_exponential_jitter=True,
+    )
+
+
+def prompt_fingerprint(llm):
+    # Everything besides the ticket fields that determines the model output
+    return hashlib.sha256(
+        orjson.dumps([
+            llm.model_id,
+            llm.temperature,
+            llm.max_tokens,
+            system_message.content,
+            TICKET_RESPONSE_EVALUATOR_TEMPLATE,
+            ticket_response_evaluation_tool,
+        ])
+    ).hexdigest()
+
+
+def cache_path(fingerprint, inputs):
+    key = hashlib.sha256(
+        orjson.dumps([
+            fingerprint,
+            inputs["ticket_subject"],
+            inputs["ticket_description"],
+            inputs["response_text"],
+        ])
+    ).hexdigest()
+    return CACHE_DIR / f"{key}.json"
+
+
+def read_cache(path):
+    # Cached evaluation, or None when there is no usable entry (missing, unreadable
+    # or not an evaluation): the ticket is then evaluated again and the entry
+    # overwritten
+    try:
+        llm_response = orjson.loads(path.read_bytes())
+    except (OSError, orjson.JSONDecodeError):
+        return None
+    return llm_response if is_evaluation(llm_response) else None
+
+
+def write_cache(path, llm_response):
+    # Only evaluations are cached, so a bad answer is never replayed on later runs
+    if not is_evaluation(llm_response):
+        raise ValueError(f"Not caching a model response that is not an evaluation: {llm_response!r}")
+
+    # Written to a temporary file first, so a crash never leaves a partial entry
+    tmp_path = path.with_suffix(".tmp")
+    tmp_path.write_bytes(orjson.dumps(llm_response))
+    os.replace(tmp_path, path)
+
+
+def write_evaluation(out, llm_response):
+    # Structured evaluation result, only formatted when LOG_LEVEL=DEBUG
+    log.debug("Evaluation %s", llm_response['output'])
+
+    # One JSON object per line
+    out.write(json.dumps(llm_response['output']) + "\n")
+
+
+async def evaluate(input_path, out, chain, fingerprint, concurrency):
+    # Tickets waiting for an evaluation, read ahead by at most QUEUE_SIZE
+    queue = asyncio.Queue(maxsize=QUEUE_SIZE)
+
+    # Copies of each ticket currently being evaluated (by cache path), so a
+    # duplicate (subject, description, response) is sent to Bedrock only once
+    in_flight = {}
+
+    async def producer():
+        # Stream the tickets from the file: raw bytes through a 64 KiB buffer, each
+        # non-empty line parsed as JSON by orjson (no decode/strip copy per line)
+        with open(input_path, "rb", buffering=1 << 16) as f:
+            for line in f:
+                if line.isspace():
+                    continue
+                ticket = orjson.loads(line)
+                inputs = {
+                    "ticket_subject": ticket["subject"],
+                    "ticket_description": ticket["description"],
+                    "response_text": ticket["response_text"],
+                }
+
+                # Cached evaluations are written right away, the rest are queued
+                path = cache_path(fingerprint, inputs)
+                if path in in_flight:
+                    in_flight[path] += 1
+                elif (cached := read_cache(path)) is not None:
+                    write_evaluation(out, cached)
+                else:
+                    in_flight[path] = 1
+                    await queue.put((path, inputs))
+
+        # One stop marker per worker
+        for _ in range(concurrency):
+            await queue.put(None)
+
+    async def worker():
+        # Evaluate queued tickets and write each one as soon as it completes, so
+        # a crash keeps everything evaluated so far
+        while (item := await queue.get()) is not None:
+            path, inputs = item
+            llm_response = await chain.ainvoke(inputs)
+            write_cache(path, llm_response)
+            for _ in range(in_flight.pop(path)):
+                write_evaluation(out, llm_response)
+
+    # The first evaluations start while the rest of the file is still being read
+    await asyncio.gather(producer(), *(worker() for _ in range(concurrency)))
+
+
+async def run(input_path=INPUT_PATH, output_path=OUTPUT_PATH, concurrency=MAX_CONCURRENCY, model_id=MODEL_ID):
+    """
+    Evaluates every ticket in the input JSONL file and saves the evaluations into
+    the output JSONL file for later use (in completion order).
+    """
+    # The Converse client is synchronous, so ainvoke runs each call in the loop's
+    # default executor: size it to the concurrency instead of the CPU count
+    asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(max_workers=concurrency))
+    CACHE_DIR.mkdir(exist_ok=True)
 
-    # Create a chain: prompt → LLM → parser
-    chat_prompt = ChatPromptTemplate.from_messages(prompt_messages)
-    chain = chat_prompt | llm | ticket_response_evaluation_parser
+    llm = build_llm(model_id, concurrency)
+    chain = build_chain(llm)
 
-    # Run the evaluation for the current ticket
-    llm_response = chain.invoke({"prompt_text": prompt_text})
+    # Written next to the output and moved over it only once every ticket is
+    # evaluated: a crash leaves the previous evaluations intact (and the ones
+    # completed so far in the cache, for the next run)
+    os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+    tmp_path = f"{output_path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8", buffering=1 << 16) as out:
+        await evaluate(input_path, out, chain, prompt_fingerprint(llm), concurrency)
+    os.replace(tmp_path, output_path)
 
-    # Print the structured evaluation result
-    print(llm_response['output'])
 
-    # Collect results in a list
-    evals.append(llm_response['output'])
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Evaluate LLM-generated ticket responses with Bedrock")
+    parser.add_argument("--input", default=INPUT_PATH, help="Processed tickets file (JSON lines)")
+    parser.add_argument("--output", default=OUTPUT_PATH, help="Evaluations output file (JSON lines)")
+    parser.add_argument("--concurrency", type=int, default=MAX_CONCURRENCY, help="Evaluations in flight at once")
+    parser.add_argument("--model-id", default=MODEL_ID, help="Bedrock model or inference profile ID")
+    cli_args = parser.parse_args()
 
-# Save all evaluations into a file for later use
-with open("Evals/ticket_evaluations.pkl", "wb") as f:
-    pickle.dump(evals, f)
\ No newline at end of file
+    # Evaluate the tickets and save the evaluations
+    asyncio.run(run(cli_args.input, cli_args.output, cli_args.concurrency, cli_args.model_id))